@@ -1,83 +1,694 @@
-from collections import deque
+from collections import OrderedDict
+import functools
+import heapq
 import random
+import time
+
+import numpy as np
+
+from junction_graph import JunctionGraph
+from lpa_star import LPAStar
+from search_result import SearchResult
+
+# Step events streamed by MazeSolver.explore
+EXPAND = "expand"
+PUSH = "push"
+PATH = "path"
+
+def label_components(maze):
+    """Label connected open regions: int32 grid of region ids, -1 on walls
+
+    Vectorized union-find over every pair of adjacent open cells: each round
+    hooks the larger root of a differing pair onto the smaller one, then
+    pointer-jumps until every cell points straight at its root.
+    """
+    rows, cols = maze.shape
+    is_open = maze == 0
+    cell = np.arange(rows * cols, dtype=np.int32).reshape(rows, cols)
+    across = is_open[:, :-1] & is_open[:, 1:]
+    down = is_open[:-1, :] & is_open[1:, :]
+    u = np.concatenate([cell[:, :-1][across], cell[:-1, :][down]])
+    w = np.concatenate([cell[:, 1:][across], cell[1:, :][down]])
+    label = cell.ravel().copy()
+
+    while u.size:
+        lu, lw = label[u], label[w]
+        differ = lu != lw
+        if not differ.any():
+            break
+        u, w = u[differ], w[differ]
+        lu, lw = lu[differ], lw[differ]
+        np.minimum.at(label, np.maximum(lu, lw), np.minimum(lu, lw))
+        while True:
+            jumped = label[label]
+            if np.array_equal(jumped, label):
+                break
+            label = jumped
+
+    label[~is_open.ravel()] = -1
+    return label.reshape(rows, cols)
+
+def run_search(search):
+    """Drive a search core generator to the end and return its result"""
+    while True:
+        try:
+            next(search)
+        except StopIteration as done:
+            return done.value
+
+def instrumented(name):
+    """Record nodes expanded, peak frontier and wall-clock time in solver.stats
+
+    The wrapped method returns padded flat indices (path, explored), plus
+    level offsets into explored for level-synchronous searches; callers
+    get a SearchResult, with the search tree too when keep_parent is set.
+    Queries between cells in different regions return an empty result
+    straight away from the connectivity index instead of flooding the region.
+    """
+    def decorate(method):
+        @functools.wraps(method)
+        def run(self, start, end, keep_parent=False):
+            self.peak_frontier = 0
+            # The connectivity index is built once per maze version and is
+            # not part of any one search, so it stays out of the timing
+            self.connectivity()
+            began = time.perf_counter()
+            levels = None
+            if self.connected(start, end):
+                path, explored, *levels = method(self, start, end)
+                levels = levels[0] if levels else None
+            else:
+                self._reset()
+                path, explored = [], []
+            elapsed = time.perf_counter() - began
+            self.stats = {
+                "algorithm": name,
+                "expanded": len(explored),
+                "peak_frontier": self.peak_frontier,
+                "path_length": len(path),
+                "time": elapsed,
+            }
+            parent = self.unpad(self.parent) if keep_parent else None
+            self.result = SearchResult(self.maze.shape, self.to_flat(explored),
+                                       self.to_flat(path), parent, self.stats, levels)
+            return self.result
+        return run
+    return decorate
 
 class MazeSolver:
-    def __init__(self, maze):
-        self.maze = maze
+    def __init__(self, maze, cache_size=32):
+        # Accepts plain arrays as well as lazily unpacked PackedMaze files
+        maze = np.asarray(maze)
         self.rows, self.cols = maze.shape
-        self.visited = set()
-        self.path = []
-        self.explored = []
-    
-    def is_valid(self, x, y):
-        return (0 <= x < self.cols and 0 <= y < self.rows and 
-                self.maze[y, x] == 0 and (x, y) not in self.visited)
-    
+        # Cells are flat int32 indices into a grid padded with a one-cell wall
+        # border, so neighbour lookups never need bounds checks.
+        self.stride = self.cols + 2
+        padded = np.ones((self.rows + 2, self.stride), dtype=np.uint8)
+        padded[1:-1, 1:-1] = maze != 0
+        self.walls = padded.ravel()
+        # The solver's own 0/1 copy of the maze: set_wall() edits show up
+        # here and the caller's array (which may be read-only) is never written
+        self.maze = padded[1:-1, 1:-1]
+        self.size = self.walls.size
+        self.visited = np.zeros(self.size, dtype=np.uint8)
+        self.parent = np.full(self.size, -1, dtype=np.int32)
+        # Same order as the (dx, dy) directions (0,1),(1,0),(0,-1),(-1,0)
+        self.offsets = [self.stride, 1, -self.stride, -1]
+        self.result = None
+        self.peak_frontier = 0
+        self.stats = None
+        # Bumped whenever the maze changes, so cached search trees go stale
+        self.version = 0
+        self.cache_size = cache_size
+        self.tree_cache = OrderedDict()
+        self.labels = None
+        self.labels_version = None
+        self.graph = None
+        self.graph_version = None
+        self.planner = None
+
+    def to_index(self, cell):
+        x, y = cell
+        return (y + 1) * self.stride + x + 1
+
+    def to_cells(self, indices):
+        indices = np.asarray(indices, dtype=np.int32)
+        ys, xs = np.divmod(indices, self.stride)
+        return list(zip((xs - 1).tolist(), (ys - 1).tolist()))
+
+    def to_flat(self, indices):
+        """Padded flat indices -> unpadded y * cols + x, as used by SearchResult"""
+        ys, xs = np.divmod(np.asarray(indices, dtype=np.int32), self.stride)
+        return (ys - 1) * self.cols + xs - 1
+
+    def unpad(self, parent):
+        """A padded parent array as one unpadded entry per maze cell, -1 kept"""
+        inner = parent.reshape(self.rows + 2, self.stride)[1:-1, 1:-1].ravel()
+        return np.where(inner >= 0, self.to_flat(inner), -1).astype(np.int32)
+
+    def connectivity(self):
+        """Flat region labels over the padded grid, rebuilt when the maze version changes"""
+        if self.labels_version != self.version:
+            padded = np.full((self.rows + 2, self.stride), -1, dtype=np.int32)
+            padded[1:-1, 1:-1] = label_components(self.maze)
+            self.labels = padded.ravel()
+            self.labels_version = self.version
+        return self.labels
+
+    def connected(self, start, end):
+        """True when end is reachable from start"""
+        start_i, end_i = self.to_index(start), self.to_index(end)
+        if start_i == end_i:
+            return True
+        labels = self.connectivity()
+        return labels[start_i] >= 0 and labels[start_i] == labels[end_i]
+
+    def _reset(self):
+        self.visited.fill(0)
+        self.parent.fill(-1)
+
+    def _build_path(self, end_index, parent=None):
+        parent = memoryview(self.parent if parent is None else parent)
+        return self.to_cells(self._chain(parent, end_index))
+
+    def _run(self, core, start, end):
+        """Run a search core on the solver's own buffers; padded (path, explored)"""
+        self._reset()
+        search = core(self.to_index(start), self.to_index(end), self.visited, self.parent)
+        order, count, path = run_search(search)
+        return path, order[:count]
+
+    def _steps(self, core, start, end):
+        """
+        Run a search core on fresh buffers as a stream of PUSH / EXPAND
+        events, then one PATH event when the end was reached
+        """
+        visited = np.zeros(self.size, dtype=np.uint8)
+        parent = np.full(self.size, -1, dtype=np.int32)
+        search = core(self.to_index(start), self.to_index(end), visited, parent, trace=True)
+        _, _, path = yield from search
+        if path:
+            yield PATH, self.to_cells(path)
+
+    @instrumented("DFS")
     def dfs(self, start, end):
         """Depth-First Search using Stack"""
-        self.visited.clear()
-        self.path.clear()
-        self.explored.clear()
-        
-        stack = [start]
-        self.visited.add(start)
-        parent = {start: None}
-        
-        directions = [(0,1),(1,0),(0,-1),(-1,0)]
-        
-        while stack:
-            x, y = stack.pop()
-            self.explored.append((x, y))
-            
-            if (x, y) == end:
-                current = end
-                while current is not None:
-                    self.path.append(current)
-                    current = parent[current]
-                self.path.reverse()
-                return self.path, self.explored
-            
-            dirs = directions.copy()
+        return self._run(self._dfs_search, start, end)
+
+    def dfs_steps(self, start, end):
+        """Depth-First Search as a stream of EXPAND / PUSH / PATH events"""
+        return self._steps(self._dfs_search, start, end)
+
+    def _dfs_search(self, start_i, end_i, visited, parent, trace=False):
+        """
+        Depth-first core shared by dfs and dfs_steps. Fills visited and
+        parent and returns (order buffer, cells expanded, path indices);
+        with trace set it also yields each PUSH and EXPAND as it happens.
+        """
+        walls = memoryview(self.walls)
+        visited = memoryview(visited)
+        parent = memoryview(parent)
+
+        # Every cell is pushed at most once, so fixed int32 buffers suffice
+        stack_buf = np.empty(self.size, dtype=np.int32)
+        order_buf = np.empty(self.size, dtype=np.int32)
+        stack = memoryview(stack_buf)
+        order = memoryview(order_buf)
+
+        stack[0] = start_i
+        top = 1
+        count = 0
+        peak = 1
+        visited[start_i] = 1
+        if trace:
+            yield PUSH, self._cell(start_i)
+
+        offsets = self.offsets
+
+        while top:
+            top -= 1
+            i = stack[top]
+            order[count] = i
+            count += 1
+            if trace:
+                yield EXPAND, self._cell(i)
+
+            if i == end_i:
+                self.peak_frontier = peak
+                return order_buf, count, self._chain(parent, end_i)
+
+            dirs = offsets.copy()
             random.shuffle(dirs)
-            
-            for dx, dy in dirs:
-                nx, ny = x + dx, y + dy
-                if self.is_valid(nx, ny):
-                    self.visited.add((nx, ny))
-                    parent[(nx, ny)] = (x, y)
-                    stack.append((nx, ny))
-        
-        return [], self.explored
-    
+
+            for d in dirs:
+                n = i + d
+                if not walls[n] and not visited[n]:
+                    visited[n] = 1
+                    parent[n] = i
+                    stack[top] = n
+                    top += 1
+                    if trace:
+                        yield PUSH, self._cell(n)
+            if top > peak:
+                peak = top
+
+        self.peak_frontier = peak
+        return order_buf, count, []
+
+    @instrumented("BFS")
     def bfs(self, start, end):
         """Breadth-First Search using Queue"""
-        self.visited.clear()
-        self.path.clear()
-        self.explored.clear()
-        
-        queue = deque([start])
-        self.visited.add(start)
-        parent = {start: None}
-        
-        directions = [(0,1),(1,0),(0,-1),(-1,0)]
-        
-        while queue:
-            x, y = queue.popleft()
-            self.explored.append((x, y))
-            
-            if (x, y) == end:
-                current = end
-                while current is not None:
-                    self.path.append(current)
-                    current = parent[current]
-                self.path.reverse()
-                return self.path, self.explored
-            
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                if self.is_valid(nx, ny):
-                    self.visited.add((nx, ny))
-                    parent[(nx, ny)] = (x, y)
-                    queue.append((nx, ny))
-        
-        return [], self.explored
+        return self._run(self._bfs_search, start, end)
+
+    def bfs_steps(self, start, end):
+        """Breadth-First Search as a stream of EXPAND / PUSH / PATH events"""
+        return self._steps(self._bfs_search, start, end)
+
+    def _bfs_search(self, start_i, end_i, visited, parent, trace=False):
+        """
+        Breadth-first core shared by bfs, bfs_steps and bfs_tree, which
+        passes end_i=None to flood the whole region. Returns (queue buffer,
+        cells dequeued, path indices); with trace set it also yields events.
+        """
+        walls = memoryview(self.walls)
+        visited = memoryview(visited)
+        parent = memoryview(parent)
+
+        # The queue buffer doubles as the exploration order: cells leave a
+        # FIFO queue in exactly the order they entered it.
+        queue_buf = np.empty(self.size, dtype=np.int32)
+        queue = memoryview(queue_buf)
+
+        queue[0] = start_i
+        head, tail = 0, 1
+        peak = 1
+        visited[start_i] = 1
+        if trace:
+            yield PUSH, self._cell(start_i)
+
+        offsets = self.offsets
+
+        while head < tail:
+            i = queue[head]
+            head += 1
+            if trace:
+                yield EXPAND, self._cell(i)
+
+            if i == end_i:
+                self.peak_frontier = peak
+                return queue_buf, head, self._chain(parent, end_i)
+
+            for d in offsets:
+                n = i + d
+                if not walls[n] and not visited[n]:
+                    visited[n] = 1
+                    parent[n] = i
+                    queue[tail] = n
+                    tail += 1
+                    if trace:
+                        yield PUSH, self._cell(n)
+            if tail - head > peak:
+                peak = tail - head
+
+        self.peak_frontier = peak
+        return queue_buf, head, []
+
+    def _wavefront(self, start_i, end_i=None, parent=None):
+        """Expand whole BFS levels at once; returns flat distances and level frontiers
+
+        When a parent array is given it is filled with the BFS tree as well.
+        """
+        dist = np.full(self.size, -1, dtype=np.int32)
+        is_open = self.walls == 0
+        offsets = np.array(self.offsets, dtype=np.int32)
+
+        frontier = np.array([start_i], dtype=np.int32)
+        dist[start_i] = 0
+        levels = [frontier]
+        level = 0
+
+        while frontier.size and (end_i is None or dist[end_i] < 0):
+            # Shift the whole frontier by each neighbour offset in one go
+            candidates = (frontier[:, None] + offsets).ravel()
+            keep = is_open[candidates] & (dist[candidates] < 0)
+            candidates = candidates[keep]
+            frontier, first = np.unique(candidates, return_index=True)
+            if not frontier.size:
+                break
+            if parent is not None:
+                sources = np.repeat(levels[-1], len(offsets))[keep]
+                parent[frontier] = sources[first]
+            level += 1
+            dist[frontier] = level
+            levels.append(frontier)
+
+        return dist, levels
+
+    def _descend(self, dist, end_i):
+        """Walk the distance field downhill from end back to the source; flat indices"""
+        indices = [end_i]
+        current = end_i
+        d = dist[end_i]
+        while d > 0:
+            for off in self.offsets:
+                n = current + off
+                if dist[n] == d - 1:
+                    current = n
+                    break
+            indices.append(current)
+            d -= 1
+        indices.reverse()
+        return indices
+
+    def distance_field(self, start):
+        """BFS distance from start to every cell (-1 where unreachable)"""
+        dist, _ = self._wavefront(self.to_index(start))
+        grid = dist.reshape(self.rows + 2, self.stride)
+        return grid[1:-1, 1:-1].copy()
+
+    @instrumented("BFS-WAVE")
+    def bfs_wavefront(self, start, end):
+        """
+        Level-synchronous BFS. The explored order is the levels back to
+        back, and the result's `levels` holds where each one starts.
+        """
+        self._reset()
+        end_i = self.to_index(end)
+        dist, levels = self._wavefront(self.to_index(start), end_i, parent=self.parent)
+        offsets = np.cumsum([0] + [level.size for level in levels])
+        self.peak_frontier = max(level.size for level in levels)
+        explored = np.concatenate(levels)
+        if dist[end_i] < 0:
+            return [], explored, offsets
+        return self._descend(dist, end_i), explored, offsets
+
+    @instrumented("A*")
+    def astar(self, start, end):
+        """A* Search using a heap ordered by g + Manhattan distance"""
+        return self._run(self._astar_search, start, end)
+
+    def astar_steps(self, start, end):
+        """A* Search as a stream of EXPAND / PUSH / PATH events"""
+        return self._steps(self._astar_search, start, end)
+
+    def _astar_search(self, start_i, end_i, closed, parent, trace=False):
+        """A* core shared by astar and astar_steps; closed marks expanded cells"""
+        walls = memoryview(self.walls)
+        closed = memoryview(closed)
+        parent = memoryview(parent)
+        cost_buf = np.full(self.size, -1, dtype=np.int32)
+        order_buf = np.empty(self.size, dtype=np.int32)
+        cost = memoryview(cost_buf)
+        order = memoryview(order_buf)
+
+        stride = self.stride
+        end_y, end_x = divmod(end_i, stride)
+        start_y, start_x = divmod(start_i, stride)
+        start_h = abs(start_x - end_x) + abs(start_y - end_y)
+
+        # Entries are (f, h, cell): ties on f go to the cell nearer the goal
+        heap = [(start_h, start_h, start_i)]
+        cost[start_i] = 0
+        count = 0
+        peak = 1
+        if trace:
+            yield PUSH, self._cell(start_i)
+
+        offsets = self.offsets
+
+        while heap:
+            _, _, i = heapq.heappop(heap)
+            if closed[i]:
+                continue
+            closed[i] = 1
+            order[count] = i
+            count += 1
+            if trace:
+                yield EXPAND, self._cell(i)
+
+            if i == end_i:
+                self.peak_frontier = peak
+                return order_buf, count, self._chain(parent, end_i)
+
+            g = cost[i] + 1
+            for d in offsets:
+                n = i + d
+                if walls[n] or closed[n]:
+                    continue
+                if cost[n] < 0 or g < cost[n]:
+                    cost[n] = g
+                    parent[n] = i
+                    ny, nx = divmod(n, stride)
+                    h = abs(nx - end_x) + abs(ny - end_y)
+                    heapq.heappush(heap, (g + h, h, n))
+                    if trace:
+                        yield PUSH, self._cell(n)
+            if len(heap) > peak:
+                peak = len(heap)
+
+        self.peak_frontier = peak
+        return order_buf, count, []
+
+    @instrumented("BI-BFS")
+    def bidirectional_bfs(self, start, end):
+        """Bidirectional BFS growing one level at a time from both ends"""
+        return self._run(self._bidirectional_search, start, end)
+
+    def bidirectional_bfs_steps(self, start, end):
+        """Bidirectional BFS as a stream of EXPAND / PUSH / PATH events"""
+        return self._steps(self._bidirectional_search, start, end)
+
+    def _bidirectional_search(self, start_i, end_i, side, forward, trace=False):
+        """
+        Bidirectional BFS core shared by bidirectional_bfs and its steps
+        version. side marks which search reached a cell first (1 forward,
+        2 backward) and forward holds the forward search tree.
+        """
+        if trace:
+            yield PUSH, self._cell(start_i)
+        if start_i == end_i:
+            self.peak_frontier = 1
+            if trace:
+                yield EXPAND, self._cell(start_i)
+            return np.array([start_i], dtype=np.int32), 1, [start_i]
+        if trace:
+            yield PUSH, self._cell(end_i)
+
+        walls = memoryview(self.walls)
+        side = memoryview(side)
+        forward = memoryview(forward)
+        backward_buf = np.full(self.size, -1, dtype=np.int32)
+        backward = memoryview(backward_buf)
+        dist_buf = np.zeros(self.size, dtype=np.int32)
+        dist = memoryview(dist_buf)
+        order_buf = np.empty(self.size, dtype=np.int32)
+        order = memoryview(order_buf)
+
+        side[start_i] = 1
+        side[end_i] = 2
+        frontiers = {1: [start_i], 2: [end_i]}
+        count = 0
+        peak = 2
+        best = None
+
+        offsets = self.offsets
+
+        while frontiers[1] and frontiers[2] and best is None:
+            # Grow the smaller frontier by one full level; every meeting seen
+            # in that level is a candidate, and the shortest one wins.
+            s = 1 if len(frontiers[1]) <= len(frontiers[2]) else 2
+            links = forward if s == 1 else backward
+            next_level = []
+            for i in frontiers[s]:
+                order[count] = i
+                count += 1
+                if trace:
+                    yield EXPAND, self._cell(i)
+                for d in offsets:
+                    n = i + d
+                    if walls[n]:
+                        continue
+                    owner = side[n]
+                    if not owner:
+                        side[n] = s
+                        links[n] = i
+                        dist[n] = dist[i] + 1
+                        next_level.append(n)
+                        if trace:
+                            yield PUSH, self._cell(n)
+                    elif owner != s:
+                        length = dist[i] + dist[n] + 1
+                        if best is None or length < best[0]:
+                            best = (length, i, n) if s == 1 else (length, n, i)
+            frontiers[s] = next_level
+            peak = max(peak, len(frontiers[1]) + len(frontiers[2]))
+
+        self.peak_frontier = peak
+        if best is None:
+            return order_buf, count, []
+
+        _, meet_forward, meet_backward = best
+        path = self._chain(forward, meet_forward) + self._chain(backward, meet_backward)[::-1]
+        return order_buf, count, path
+
+    def junction_graph(self):
+        """Corridor-contracted junction graph, rebuilt when the maze version changes"""
+        if self.graph_version != self.version:
+            self.graph = JunctionGraph(self.walls, self.stride)
+            self.graph_version = self.version
+        return self.graph
+
+    @instrumented("JUNCTION A*")
+    def junction_astar(self, start, end):
+        """A* over the junction graph; corridors are expanded to cells only for the path"""
+        self._reset()
+        start_i = self.to_index(start)
+        end_i = self.to_index(end)
+        if start_i == end_i:
+            self.peak_frontier = 1
+            return [start_i], [start_i]
+        path, expanded, self.peak_frontier = self.junction_graph().search(start_i, end_i)
+        return path, expanded
+
+    def set_wall(self, cell, wall=True):
+        """
+        Close (or open) one cell. The version bump retires cached trees,
+        labels and junction graphs; the incremental planner is told about
+        the cell instead, so replan() only repairs what the edit affects.
+        Only the solver's own grid changes, never the maze it was built from.
+        Returns False when the cell already had that state.
+        """
+        i = self.to_index(cell)
+        if bool(self.walls[i]) == bool(wall):
+            return False
+        self.walls[i] = 1 if wall else 0
+        self.version += 1
+        if self.planner is not None:
+            self.planner.cells_changed([i])
+        return True
+
+    def replan(self, start, end):
+        """
+        Shortest path by Lifelong Planning A*. The planner for (start, end)
+        survives set_wall() edits, so after an edit only the affected cells
+        are re-expanded; stats and the result's explored cells cover this
+        repair only. A new start or end starts a fresh planner.
+        """
+        start_i, end_i = self.to_index(start), self.to_index(end)
+        planner = self.planner
+        if planner is None or (planner.start_i, planner.goal_i) != (start_i, end_i):
+            planner = self.planner = LPAStar(self.walls, self.stride, start_i, end_i)
+        began = time.perf_counter()
+        expanded = planner.compute()
+        path = planner.path()
+        self.stats = {
+            "algorithm": "LPA*",
+            "expanded": len(expanded),
+            "peak_frontier": planner.peak,
+            "path_length": len(path),
+            "time": time.perf_counter() - began,
+        }
+        self.result = SearchResult(self.maze.shape, self.to_flat(expanded),
+                                   self.to_flat(path), None, self.stats)
+        return self.result
+
+    def bfs_tree(self, source):
+        """BFS parent array rooted at source, cached per (source, maze version)"""
+        key = (self.to_index(source), self.version)
+        tree = self.tree_cache.get(key)
+        if tree is not None:
+            self.tree_cache.move_to_end(key)
+            return tree
+        tree = np.full(self.size, -1, dtype=np.int32)
+        run_search(self._bfs_search(key[0], None, np.zeros(self.size, dtype=np.uint8), tree))
+        self.tree_cache[key] = tree
+        while len(self.tree_cache) > self.cache_size:
+            self.tree_cache.popitem(last=False)
+        return tree
+
+    def query(self, source, targets):
+        """Shortest paths from source to each target, all read off one BFS tree"""
+        source_i = self.to_index(source)
+        tree = None
+        paths = []
+        for target in targets:
+            target_i = self.to_index(target)
+            if target_i != source_i and not self.connected(source, target):
+                paths.append([])
+                continue
+            if tree is None:
+                tree = self.bfs_tree(source)
+            paths.append(self._build_path(target_i, tree))
+        return paths
+
+    def query_pairs(self, pairs):
+        """Shortest path for each (start, end) pair; pairs sharing a start share a tree"""
+        by_source = {}
+        for n, (start, end) in enumerate(pairs):
+            by_source.setdefault(start, []).append((n, end))
+        paths = [None] * len(pairs)
+        for start, jobs in by_source.items():
+            found = self.query(start, [end for _, end in jobs])
+            for (n, _), path in zip(jobs, found):
+                paths[n] = path
+        return paths
+
+    def _cell(self, index):
+        y, x = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+    def _chain(self, parent, index):
+        """Flat indices from the root of a parent array down to index"""
+        indices = []
+        while index != -1:
+            indices.append(index)
+            index = parent[index]
+        indices.reverse()
+        return indices
+
+    def explore(self, algorithm, start, end):
+        """
+        Stream (event, payload) pairs from the solver registered under algorithm:
+        EXPAND and PUSH carry one cell, PATH carries the finished path. Nothing
+        is collected, so memory stays bounded by the solver's own arrays.
+        solver.stats is filled in once the stream is exhausted; its time only
+        counts the solver's own work, not time spent by the consumer.
+        """
+        self.stats = None
+        self.peak_frontier = 0
+        if self.connected(start, end):
+            steps = getattr(self, SOLVERS[algorithm] + "_steps")(start, end)
+        else:
+            steps = iter(())
+        expanded = path_length = 0
+        busy = 0.0
+        while True:
+            began = time.perf_counter()
+            event = next(steps, None)
+            busy += time.perf_counter() - began
+            if event is None:
+                break
+            if event[0] == EXPAND:
+                expanded += 1
+            elif event[0] == PATH:
+                path_length = len(event[1])
+            yield event
+        self.stats = {
+            "algorithm": algorithm,
+            "expanded": expanded,
+            "peak_frontier": self.peak_frontier,
+            "path_length": path_length,
+            "time": busy,
+        }
+
+    def solve(self, algorithm, start, end, keep_parent=False):
+        """Run the solver registered under algorithm in SOLVERS; returns a SearchResult"""
+        return getattr(self, SOLVERS[algorithm])(start, end, keep_parent=keep_parent)
+
+# Display name -> MazeSolver method, in the order the UI lists them
+SOLVERS = {
+    "DFS": "dfs",
+    "BFS": "bfs",
+    "A*": "astar",
+    "BI-BFS": "bidirectional_bfs",
+}
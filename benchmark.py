@@ -0,0 +1,212 @@
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from algorithms import MazeSolver, SOLVERS
+from dataset import MAZE_TYPE_NAMES, parse_size
+from maze_generator import MazeGenerator
+
+FIELDS = ["width", "height", "maze_type", "seed", "solver",
+          "generate_time", "generate_peak_kb", "setup_peak_kb", "solve_time", "solve_peak_kb",
+          "expanded", "peak_frontier", "path_length", "draw_time"]
+KEY_FIELDS = ["width", "height", "maze_type", "seed", "solver"]
+# Metrics that may drift with the machine, compared against a threshold
+TIMED_FIELDS = ["generate_time", "solve_time", "draw_time",
+                "generate_peak_kb", "setup_peak_kb", "solve_peak_kb"]
+# Metrics fixed by the seed: any change means behaviour changed
+EXACT_FIELDS = ["expanded", "path_length"]
+
+def best_time(func, repeat):
+    """Best wall-clock time of `repeat` calls, and the last call's result"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+def peak_kb(func):
+    """Peak Python heap growth of one call, in KiB (tracemalloc)"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+def bench_maze(width, height, maze_type, seed, solvers, repeat=3, render=True):
+    """
+    Benchmark one seeded maze: generation, then each solver from corner to
+    corner, then draw_maze with that solver's search highlighted. Times are
+    taken without tracemalloc, which slows Python code down badly; memory is
+    measured in a separate traced run. Returns one result dict per solver.
+    """
+    generate = lambda: MazeGenerator(width, height, seed=seed).get_maze(maze_type=maze_type)
+    generate_time, maze = best_time(generate, repeat)
+    generate_peak = peak_kb(generate)
+    start, end = (1, 1), (maze.shape[1] - 2, maze.shape[0] - 2)
+    # Solver buffers and the connectivity index are shared setup, measured
+    # apart so the solve peak shows only the search itself
+    setup_peak = peak_kb(lambda: MazeSolver(maze).connected(start, end))
+
+    visualizer = None
+    if render:
+        # Imported late so solver-only runs never need pygame or a display
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        from visualizer import MazeVisualizer
+        visualizer = MazeVisualizer(maze, cell_size=max(1, 450 // max(maze.shape)))
+        visualizer.start, visualizer.end = start, end
+
+    results = []
+    for name in solvers:
+        solver = MazeSolver(maze)
+        def solve(solver=solver, name=name):
+            # DFS shuffles neighbours with the global RNG; reseed so runs repeat
+            random.seed(seed)
+            return solver.solve(name, start, end)
+        solve_time, (path, explored) = best_time(solve, repeat)
+        stats = dict(solver.stats)
+        traced = MazeSolver(maze)
+        traced.connected(start, end)
+        solve_peak = peak_kb(lambda: solve(traced))
+        draw_time = None
+        if visualizer is not None:
+            draw = lambda: visualizer.draw_maze(highlight_explored=explored,
+                                                highlight_path=path, color_type=name)
+            draw_time, _ = best_time(draw, repeat)
+        results.append({
+            "width": width,
+            "height": height,
+            "maze_type": maze_type,
+            "seed": seed,
+            "solver": name,
+            "generate_time": generate_time,
+            "generate_peak_kb": generate_peak,
+            "setup_peak_kb": setup_peak,
+            "solve_time": solve_time,
+            "solve_peak_kb": solve_peak,
+            "expanded": stats["expanded"],
+            "peak_frontier": stats["peak_frontier"],
+            "path_length": stats["path_length"],
+            "draw_time": draw_time,
+        })
+    if visualizer is not None:
+        visualizer.quit()
+    return results
+
+def run_suite(sizes, maze_types, seeds, solvers, repeat=3, render=True, log=None):
+    """Sweep every size, maze type and seed; returns the flat list of result dicts"""
+    results = []
+    for width, height in sizes:
+        for maze_type in maze_types:
+            for seed in seeds:
+                rows = bench_maze(width, height, maze_type, seed, solvers, repeat, render)
+                results.extend(rows)
+                if log:
+                    log(f"✓ {MAZE_TYPE_NAMES[maze_type]} {width}x{height} seed {seed}: "
+                        f"generated in {rows[0]['generate_time'] * 1000:.1f} ms")
+    return results
+
+def save_results(results, json_path=None, csv_path=None):
+    if json_path:
+        meta = {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        with open(json_path, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+    if csv_path:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+def compare(results, baseline, threshold=0.25, min_time=0.01):
+    """
+    Regressions of results against a baseline run, matched by size, type,
+    seed and solver. Times and peak memory regress when they grow by more
+    than `threshold` (times under min_time seconds are too noisy to judge);
+    explored counts and path lengths regress on any change, since seeded
+    mazes make them deterministic. Returns a list of messages.
+    """
+    base = {tuple(row[k] for k in KEY_FIELDS): row for row in baseline}
+    regressions = []
+    for row in results:
+        key = tuple(row[k] for k in KEY_FIELDS)
+        old = base.get(key)
+        if old is None:
+            continue
+        label = f"{row['solver']} on {MAZE_TYPE_NAMES[row['maze_type']]} " \
+                f"{row['width']}x{row['height']} seed {row['seed']}"
+        for field in TIMED_FIELDS:
+            new_value, old_value = row.get(field), old.get(field)
+            if new_value is None or old_value is None:
+                continue
+            if field.endswith("_time") and max(new_value, old_value) < min_time:
+                continue
+            if new_value > old_value * (1 + threshold):
+                regressions.append(f"{label}: {field} {old_value:.4g} → {new_value:.4g} "
+                                   f"(+{100 * (new_value / max(old_value, 1e-12) - 1):.0f}%)")
+        for field in EXACT_FIELDS:
+            if row[field] != old[field]:
+                regressions.append(f"{label}: {field} changed {old[field]} → {row[field]}")
+    return regressions
+
+def build_parser(parser=None):
+    parser = parser or argparse.ArgumentParser(
+        description="Benchmark maze generation, solving and rendering headlessly")
+    parser.add_argument("--size", type=parse_size, action="append",
+                        help="maze size in cells, WIDTHxHEIGHT (repeatable, default 20x20 and 100x100)")
+    parser.add_argument("--type", type=int, choices=sorted(MAZE_TYPE_NAMES), action="append",
+                        dest="maze_types", help="maze type (repeatable, default 1 and 2)")
+    parser.add_argument("--seeds", type=int, default=3, help="seeds per size and type")
+    parser.add_argument("--solver", choices=list(SOLVERS), action="append", dest="solvers",
+                        help="solver to run (repeatable, default all)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement")
+    parser.add_argument("--no-render", action="store_true", help="skip timing draw_maze")
+    parser.add_argument("--json", help="write results as JSON")
+    parser.add_argument("--csv", help="write results as CSV")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before flagging a regression (0.25 = 25%%)")
+    return parser
+
+def run(args):
+    results = run_suite(args.size or [(20, 20), (100, 100)], args.maze_types or [1, 2],
+                        range(args.seeds), args.solvers or list(SOLVERS),
+                        args.repeat, not args.no_render, log=print)
+    save_results(results, args.json, args.csv)
+    for row in results:
+        draw = f" | draw {row['draw_time'] * 1000:.2f} ms" if row["draw_time"] is not None else ""
+        print(f"{row['solver']:>7} {MAZE_TYPE_NAMES[row['maze_type']]} "
+              f"{row['width']}x{row['height']} seed {row['seed']}: "
+              f"solve {row['solve_time'] * 1000:.2f} ms | {row['solve_peak_kb']:.0f} KiB | "
+              f"explored {row['expanded']} | path {row['path_length']}{draw}")
+    if args.baseline:
+        regressions = compare(results, load_results(args.baseline), args.threshold)
+        for message in regressions:
+            print(f"✗ {message}")
+        if regressions:
+            return 1
+        print("✓ No regressions against baseline")
+    return 0
+
+def main(argv=None):
+    return run(build_parser().parse_args(argv))
+
+if __name__ == "__main__":
+    sys.exit(main())
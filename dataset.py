@@ -0,0 +1,99 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+
+import numpy as np
+
+from maze_generator import MazeGenerator
+
+MAZE_TYPE_NAMES = {1: "perfect", 2: "multipath", 3: "eller"}
+
+def job_seeds(seed, count, width, height, maze_type):
+    """Deterministic per-maze seeds, independent of worker count or scheduling"""
+    # SeedSequence only takes non-negative entries; negative seeds map to
+    # their 64-bit two's complement, leaving existing seeds unchanged
+    sequence = np.random.SeedSequence([seed & (2 ** 64 - 1), width, height, maze_type])
+    return sequence.generate_state(count, dtype=np.uint64).tolist()
+
+def generate_job(job):
+    """Worker entry point: build one maze from (width, height, maze_type, seed)"""
+    width, height, maze_type, seed = job
+    maze = MazeGenerator(width, height, seed=seed).get_maze(maze_type=maze_type)
+    return maze.astype(np.uint8)
+
+def generate_stack(path, count, width, height, maze_type=1, seed=0,
+                   executor=None, chunk_size=256):
+    """
+    Generate count mazes of one size and type into a (count, H, W) uint8
+    .npy memmap at path, chunk by chunk, and return their seeds.
+    """
+    seeds = job_seeds(seed, count, width, height, maze_type)
+    shape = (count, height * 2 + 1, width * 2 + 1)
+    stack = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=shape)
+    for first in range(0, count, chunk_size):
+        jobs = [(width, height, maze_type, s) for s in seeds[first:first + chunk_size]]
+        if executor is not None:
+            mazes = executor.map(generate_job, jobs, chunksize=16)
+        else:
+            mazes = map(generate_job, jobs)
+        for n, maze in enumerate(mazes):
+            stack[first + n] = maze
+        stack.flush()
+    del stack
+    return seeds
+
+def generate_corpus(out_dir, count, sizes, maze_types, seed=0, workers=None, chunk_size=256):
+    """
+    Generate count mazes for every (size, maze type) combination across a
+    process pool. Each combination gets its own memmapped stack, and
+    manifest.json records the files and per-maze seeds.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {"seed": seed, "count": count, "stacks": []}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for width, height in sizes:
+            for maze_type in maze_types:
+                name = f"{MAZE_TYPE_NAMES[maze_type]}_{width}x{height}.npy"
+                seeds = generate_stack(os.path.join(out_dir, name), count, width, height,
+                                       maze_type, seed, executor, chunk_size)
+                manifest["stacks"].append({
+                    "file": name,
+                    "width": width,
+                    "height": height,
+                    "maze_type": maze_type,
+                    "seeds": seeds,
+                })
+    with open(os.path.join(out_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def parse_size(text):
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height or width)
+
+def build_parser(parser=None):
+    parser = parser or argparse.ArgumentParser(description="Generate a maze corpus in parallel")
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--count", type=int, default=100, help="mazes per size and type")
+    parser.add_argument("--size", type=parse_size, action="append",
+                        help="maze size in cells, WIDTHxHEIGHT (repeatable, default 20x20)")
+    parser.add_argument("--type", type=int, choices=sorted(MAZE_TYPE_NAMES), action="append",
+                        dest="maze_types", help="maze type (repeatable, default 1)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for the corpus")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--chunk-size", type=int, default=256, help="mazes written per chunk")
+    return parser
+
+def run(args):
+    manifest = generate_corpus(args.out, args.count, args.size or [(20, 20)],
+                               args.maze_types or [1], args.seed, args.workers,
+                               args.chunk_size)
+    for stack in manifest["stacks"]:
+        print(f"✓ {stack['file']}: {args.count} mazes")
+
+def main(argv=None):
+    run(build_parser().parse_args(argv))
+
+if __name__ == "__main__":
+    main()
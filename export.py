@@ -0,0 +1,126 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count
+import os
+import struct
+import sys
+import zlib
+
+import numpy as np
+
+from styles import state_palette
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+def block_max(state, factor):
+    """Shrink a state grid by factor, each block keeping its highest state"""
+    if factor == 1:
+        return state.copy()
+    h, w = state.shape
+    rows, cols = -(-h // factor), -(-w // factor)
+    padded = np.zeros((rows * factor, cols * factor), dtype=state.dtype)
+    padded[:h, :w] = state
+    return padded.reshape(rows, factor, cols, factor).max(axis=(1, 3))
+
+def render_frames(maze, result, start, end, color_type=None, cells_per_frame=500,
+                  cell_size=1, shrink=1):
+    """
+    Yield the animation of a SearchResult as (H, W, 3) uint8 RGB frames:
+    explored cells in order, then the path, cells_per_frame at a time,
+    starting from the bare maze. Pure NumPy, so no display is needed.
+    With shrink > 1 each pixel block shows the highest state of the cells
+    it covers, so walls, search and path stay visible on huge mazes.
+    """
+    palette = np.asarray(state_palette(color_type or result.algorithm), dtype=np.uint8)
+    state = (np.asarray(maze) != 0).astype(np.uint8)
+    state[start[1], start[0]] = 4
+    state[end[1], end[0]] = 5
+    small = block_max(state, shrink)
+    del state
+
+    explored, path = result.explored, result.path
+    cols = result.shape[1]
+    total = len(explored) + len(path)
+    shown = 0
+    while True:
+        pixels = palette[small]
+        if cell_size != 1:
+            pixels = pixels.repeat(cell_size, axis=0).repeat(cell_size, axis=1)
+        yield pixels
+        if shown >= total:
+            return
+        step = min(total, shown + cells_per_frame)
+        for cells, value in ((explored[min(shown, len(explored)):min(step, len(explored))], 2),
+                             (path[max(0, shown - len(explored)):max(0, step - len(explored))], 3)):
+            if len(cells):
+                ys, xs = np.divmod(cells, cols)
+                ys, xs = ys // shrink, xs // shrink
+                small[ys, xs] = np.maximum(small[ys, xs], value)
+        shown = step
+
+def encode_png(frame, level=6):
+    """Encode an RGB frame as PNG bytes with zlib alone"""
+    height, width, _ = frame.shape
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = frame.reshape(height, -1)
+
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (PNG_SIGNATURE + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(rows.tobytes(), level)) + chunk(b"IEND", b""))
+
+def write_png(path, frame, level=6):
+    """Worker entry point: encode one frame and write it to path"""
+    with open(path, "wb") as f:
+        f.write(encode_png(frame, level))
+    return path
+
+def export_png(frames, out_dir, workers=None, level=6, prefix="frame"):
+    """
+    Write frames as out_dir/frame_000000.png ... Encoding runs on a process
+    pool while the next frames render; at most a few frames per worker are
+    in flight, so memory stays bounded. workers=0 encodes inline.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    names = (os.path.join(out_dir, f"{prefix}_{n:06d}.png") for n in count())
+    written = 0
+    if workers == 0:
+        for frame in frames:
+            write_png(next(names), frame, level)
+            written += 1
+        return written
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        limit = 4 * (workers or os.cpu_count() or 1)
+        for frame in frames:
+            pending.append(executor.submit(write_png, next(names), frame, level))
+            if len(pending) >= limit:
+                pending.popleft().result()
+                written += 1
+        for future in pending:
+            future.result()
+            written += 1
+    return written
+
+def export_raw(frames, out):
+    """
+    Write frames back to back as raw rgb24 video to a path or "-" for
+    stdout, e.g. for ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH -i FILE.
+    Returns (frame count, (width, height)).
+    """
+    stream = sys.stdout.buffer if out == "-" else open(out, "wb")
+    written, size = 0, None
+    try:
+        for frame in frames:
+            stream.write(np.ascontiguousarray(frame).tobytes())
+            written += 1
+            size = (frame.shape[1], frame.shape[0])
+    finally:
+        if stream is not sys.stdout.buffer:
+            stream.close()
+        else:
+            stream.flush()
+    return written, size
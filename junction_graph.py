@@ -0,0 +1,161 @@
+import heapq
+
+import numpy as np
+
+class JunctionGraph:
+    """Maze compressed to junctions and dead ends joined by corridor edges
+
+    Works on the wall-padded flat grid used by MazeSolver. Every open cell
+    whose number of open neighbours is not exactly two becomes a node; each
+    run of two-neighbour corridor cells between nodes becomes one weighted
+    edge that remembers its length and its cells.
+    """
+
+    def __init__(self, walls, stride):
+        self.walls = walls
+        self.stride = stride
+        self.offsets = [stride, 1, -stride, -1]
+        size = walls.size
+        is_open = walls == 0
+
+        degree = np.zeros(size, dtype=np.int8)
+        for off in self.offsets:
+            degree[is_open] += is_open[np.arange(size)[is_open] + off]
+        node_mask = is_open & (degree != 2)
+
+        # Corridor cell -> (edge id, position along that edge's run)
+        self.edge_of = np.full(size, -1, dtype=np.int32)
+        self.position = np.zeros(size, dtype=np.int32)
+        self.is_node = node_mask
+        self.edges = []
+        self.adjacency = {}
+
+        for node in np.flatnonzero(node_mask).tolist():
+            self._walk_from(node)
+        # Closed loops of corridor cells have no node on them: promote one
+        # cell per loop so those cells are still reachable.
+        stray = np.flatnonzero(is_open & ~node_mask & (self.edge_of < 0))
+        for cell in stray.tolist():
+            if self.edge_of[cell] < 0 and not self.is_node[cell]:
+                self.is_node[cell] = True
+                self._walk_from(cell)
+
+    @property
+    def node_count(self):
+        return len(self.adjacency)
+
+    def _walk_from(self, node):
+        walls = self.walls
+        is_node = self.is_node
+        self.adjacency.setdefault(node, [])
+        for off in self.offsets:
+            first = node + off
+            if walls[first]:
+                continue
+            if is_node[first]:
+                if node < first:
+                    self._add_edge([node, first])
+                continue
+            if self.edge_of[first] >= 0:
+                continue
+            run = [node]
+            prev, cur = node, first
+            while not is_node[cur]:
+                run.append(cur)
+                for d in self.offsets:
+                    nxt = cur + d
+                    if nxt != prev and not walls[nxt]:
+                        break
+                prev, cur = cur, nxt
+            run.append(cur)
+            self._add_edge(run)
+
+    def _add_edge(self, run):
+        edge_id = len(self.edges)
+        cells = np.array(run, dtype=np.int32)
+        self.edges.append(cells)
+        interior = cells[1:-1]
+        self.edge_of[interior] = edge_id
+        self.position[interior] = np.arange(1, len(run) - 1, dtype=np.int32)
+        u, v, length = run[0], run[-1], len(run) - 1
+        self.adjacency.setdefault(u, []).append((v, length, edge_id))
+        self.adjacency.setdefault(v, []).append((u, length, edge_id))
+
+    def _attach(self, cell):
+        """Edges linking a (possibly mid-corridor) cell to the graph"""
+        if self.is_node[cell]:
+            return []
+        edge_id = self.edge_of[cell]
+        cells = self.edges[edge_id]
+        k = int(self.position[cell])
+        return [(int(cells[0]), k, (edge_id, k, 0)),
+                (int(cells[-1]), len(cells) - 1 - k, (edge_id, k, len(cells) - 1))]
+
+    def _cells_between(self, link):
+        """Corridor cells from one end of a link to the other, inclusive"""
+        edge_id, a, b = link
+        cells = self.edges[edge_id]
+        if a <= b:
+            return cells[a:b + 1]
+        return cells[b:a + 1][::-1]
+
+    def search(self, start_i, end_i):
+        """A* over junctions (Manhattan heuristic); returns (path, expanded nodes, peak heap)"""
+        stride = self.stride
+        end_y, end_x = divmod(end_i, stride)
+
+        def heuristic(cell):
+            y, x = divmod(cell, stride)
+            return abs(x - end_x) + abs(y - end_y)
+
+        # Links are (edge id, from position, to position) along an edge run;
+        # start and end become temporary nodes when they sit mid-corridor.
+        extra = {}
+        for v, length, link in self._attach(start_i):
+            extra.setdefault(start_i, []).append((v, length, link))
+        for v, length, (edge_id, k, other) in self._attach(end_i):
+            extra.setdefault(v, []).append((end_i, length, (edge_id, other, k)))
+        if (not self.is_node[start_i] and not self.is_node[end_i]
+                and self.edge_of[start_i] == self.edge_of[end_i]):
+            edge_id = int(self.edge_of[start_i])
+            ks, ke = int(self.position[start_i]), int(self.position[end_i])
+            extra[start_i].append((end_i, abs(ks - ke), (edge_id, ks, ke)))
+
+        cost = {start_i: 0}
+        came_from = {start_i: None}
+        expanded = []
+        heap = [(heuristic(start_i), 0, start_i)]
+        closed = set()
+        peak = 1
+        while heap:
+            _, g, node = heapq.heappop(heap)
+            if node in closed:
+                continue
+            closed.add(node)
+            expanded.append(node)
+            if node == end_i:
+                break
+            neighbours = [(v, length, (edge_id, 0, len(self.edges[edge_id]) - 1)
+                           if self.edges[edge_id][0] == node
+                           else (edge_id, len(self.edges[edge_id]) - 1, 0))
+                          for v, length, edge_id in self.adjacency.get(node, [])]
+            neighbours.extend(extra.get(node, []))
+            for v, length, link in neighbours:
+                ng = g + length
+                if v not in closed and ng < cost.get(v, ng + 1):
+                    cost[v] = ng
+                    came_from[v] = (node, link)
+                    heapq.heappush(heap, (ng + heuristic(v), ng, v))
+            peak = max(peak, len(heap))
+        else:
+            return [], expanded, peak
+
+        # Expand the junction route back into a cell-level path
+        pieces = []
+        node = end_i
+        while came_from[node] is not None:
+            node, link = came_from[node]
+            pieces.append(self._cells_between(link)[1:])
+        pieces.append(np.array([start_i], dtype=np.int32))
+        pieces.reverse()
+        return np.concatenate(pieces).tolist(), expanded, peak
@@ -0,0 +1,124 @@
+import heapq
+
+import numpy as np
+
+INF = 1 << 30
+
+class LPAStar:
+    """Lifelong Planning A* between a fixed start and goal on a padded wall grid
+
+    g holds each cell's settled distance from start and rhs its one-step
+    lookahead; cells where the two disagree are queued by
+    (min(g, rhs) + h, min(g, rhs)). When walls change, cells_changed() only
+    re-queues the edited cells, and compute() then re-expands just the
+    cells whose distances actually moved, so an edit away from the current
+    solution costs next to nothing. The walls array is read live, so the
+    owner edits it first and then reports the change. The heap keeps
+    superseded entries until they surface, so `inconsistent` counts the
+    cells really waiting, and compute() records its peak in `peak`.
+    """
+
+    def __init__(self, walls, stride, start_i, goal_i):
+        self.walls = walls
+        self.stride = stride
+        self.offsets = [stride, 1, -stride, -1]
+        self.start_i = start_i
+        self.goal_i = goal_i
+        self.goal_y, self.goal_x = divmod(goal_i, stride)
+        self.g_buf = np.full(walls.size, INF, dtype=np.int32)
+        self.rhs_buf = np.full(walls.size, INF, dtype=np.int32)
+        self.g = memoryview(self.g_buf)
+        self.rhs = memoryview(self.rhs_buf)
+        self.rhs[start_i] = 0
+        self.heap = [self.key(start_i) + (start_i,)]
+        self.inconsistent = 1
+        self.peak = 1
+
+    def key(self, i):
+        y, x = divmod(i, self.stride)
+        best = min(self.g[i], self.rhs[i])
+        return (best + abs(x - self.goal_x) + abs(y - self.goal_y), best)
+
+    def update(self, i, walls):
+        """Recompute rhs for cell i and queue it if it is now inconsistent"""
+        g, rhs = self.g, self.rhs
+        was_open = g[i] != rhs[i]
+        if i != self.start_i:
+            best = INF
+            if not walls[i]:
+                for d in self.offsets:
+                    n = i + d
+                    if not walls[n] and g[n] < best:
+                        best = g[n]
+                best = min(INF, best + 1)
+            rhs[i] = best
+        if g[i] != rhs[i]:
+            heapq.heappush(self.heap, self.key(i) + (i,))
+            self.inconsistent += not was_open
+        elif was_open:
+            self.inconsistent -= 1
+
+    def cells_changed(self, indices):
+        """Queue edited cells and their open neighbours for repair"""
+        walls = memoryview(self.walls)
+        for i in indices:
+            self.update(i, walls)
+            for d in self.offsets:
+                if not walls[i + d]:
+                    self.update(i + d, walls)
+
+    def compute(self):
+        """Bring the search up to date; returns the cells expanded, in order"""
+        walls = memoryview(self.walls)
+        g, rhs = self.g, self.rhs
+        heap = self.heap
+        goal = self.goal_i
+        expanded = []
+        self.peak = self.inconsistent
+        while heap:
+            k1, k2, u = heap[0]
+            # Entries are never removed in place; skip the superseded ones
+            if g[u] == rhs[u] or (k1, k2) != self.key(u):
+                heapq.heappop(heap)
+                continue
+            if (k1, k2) >= self.key(goal) and g[goal] == rhs[goal]:
+                break
+            heapq.heappop(heap)
+            expanded.append(u)
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]
+                self.inconsistent -= 1
+            else:
+                g[u] = INF
+                if rhs[u] == INF:
+                    self.inconsistent -= 1
+                self.update(u, walls)
+            for d in self.offsets:
+                n = u + d
+                if not walls[n]:
+                    self.update(n, walls)
+            if self.inconsistent > self.peak:
+                self.peak = self.inconsistent
+        return expanded
+
+    def path(self):
+        """Flat indices from start to goal down the g gradient, or [] if unreachable"""
+        g = self.g
+        if g[self.goal_i] >= INF:
+            return []
+        walls = memoryview(self.walls)
+        indices = [self.goal_i]
+        current = self.goal_i
+        while current != self.start_i:
+            # Step to the open neighbour with the smallest settled distance
+            best = current
+            for d in self.offsets:
+                n = current + d
+                if not walls[n] and g[n] < g[best]:
+                    best = n
+            if best == current:
+                return []
+            current = best
+            indices.append(current)
+        indices.reverse()
+        return indices
@@ -1,17 +1,36 @@
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+import benchmark
+import dataset
+import export
+from algorithms import MazeSolver, SOLVERS
+from dataset import MAZE_TYPE_NAMES, parse_size
+from maze_format import load_maze, save_maze
 from maze_generator import MazeGenerator
-from algorithms import MazeSolver
-from visualizer import MazeVisualizer
+from search_result import load_result, save_result
+
+def interactive(maze_type=None):
+    # pygame is only loaded when a window is actually wanted
+    from visualizer import MazeVisualizer
 
-def main():
     print("="*70)
     print(" "*15 + "INTERACTIVE MAZE SOLVER - DFS vs BFS")
     print("="*70)
-    print("\nSelect maze type:")
-    print("  1. Perfect Maze (one unique path)")
-    print("  2. Multi-Path Maze (multiple routes, BFS finds shortest)")
+    if maze_type is None:
+        print("\nSelect maze type:")
+        print("  1. Perfect Maze (one unique path)")
+        print("  2. Multi-Path Maze (multiple routes, BFS finds shortest)")
 
-    choice = input("Enter choice [1 or 2, default 1]: ").strip() or "1"
-    maze_type = int(choice) if choice in ["1", "2"] else 1
+        choice = input("Enter choice [1 or 2, default 1]: ").strip() or "1"
+        maze_type = int(choice) if choice in ["1", "2"] else 1
 
     running = True
     maze_size_index = 0
@@ -57,5 +76,235 @@ def main():
     print(" "*20 + "✓ Thank you for using Maze Solver!")
     print("="*70 + "\n")
 
+def parse_cell(text):
+    x, _, y = text.partition(",")
+    return int(x), int(y)
+
+def build_maze(width, height, maze_type, seed):
+    started = time.perf_counter()
+    maze = MazeGenerator(width, height, seed=seed).get_maze(maze_type=maze_type)
+    return maze, time.perf_counter() - started
+
+def endpoints(maze, start=None, end=None):
+    """Explicit cells first, then the ones stored in a .maze file, then opposite corners"""
+    rows, cols = maze.shape
+    start = start or getattr(maze, "start", None) or (1, 1)
+    end = end or getattr(maze, "end", None) or (cols - 2, rows - 2)
+    return start, end
+
+def endpoints_from_args(args, maze):
+    """endpoints() for --start/--end, reporting cells off the grid as usage errors"""
+    start, end = endpoints(maze, args.start, args.end)
+    rows, cols = maze.shape
+    for flag, (x, y) in (("--start", start), ("--end", end)):
+        if not (0 <= x < cols and 0 <= y < rows):
+            args.parser.error(f"{flag} {x},{y} is outside the {cols}x{rows} maze grid")
+    return start, end
+
+def solve_record(solver, algorithm, start, end, seed=None, with_path=False, trace_dir=None):
+    """Solve once and describe the run as a JSON-ready dict"""
+    # DFS breaks ties with the global RNG; seeding it makes runs reproducible
+    random.seed(seed)
+    result = solver.solve(algorithm, start, end, keep_parent=trace_dir is not None)
+    record = dict(result.stats)
+    record.update(start=list(start), end=list(end), found=result.found)
+    if with_path:
+        record["path"] = result.path_cells().tolist()
+    if trace_dir:
+        record["trace"] = os.path.join(trace_dir, SOLVERS[algorithm] + ".npz")
+        save_result(record["trace"], result)
+    return record
+
+def cmd_generate(args):
+    width, height = args.size
+    maze, elapsed = build_maze(width, height, args.type, args.seed)
+    start, end = endpoints(maze)
+    if args.out.endswith(".npy"):
+        np.save(args.out, maze.astype(np.uint8))
+    else:
+        save_maze(args.out, maze, args.type, args.seed, start, end)
+    emit({"file": args.out, "width": width, "height": height, "maze_type": args.type,
+          "seed": args.seed, "shape": list(maze.shape), "start": list(start),
+          "end": list(end), "generate_time": elapsed})
+
+def maze_from_args(args):
+    """The --maze file if given, else a fresh maze from --size/--type/--seed; returns (maze, seed)"""
+    if args.maze:
+        maze = load_maze(args.maze)
+        return maze, maze.seed if args.seed is None else args.seed
+    width, height = args.size
+    maze, _ = build_maze(width, height, args.type, args.seed)
+    return maze, args.seed
+
+def cmd_solve(args):
+    maze, seed = maze_from_args(args)
+    start, end = endpoints_from_args(args, maze)
+    solver = MazeSolver(maze)
+    if args.trace_dir:
+        os.makedirs(args.trace_dir, exist_ok=True)
+    records = [solve_record(solver, name, start, end, seed, args.path, args.trace_dir)
+               for name in args.algorithms or list(SOLVERS)]
+    emit({"shape": list(solver.maze.shape), "seed": seed, "results": records})
+    return 0 if all(record["found"] for record in records) else 1
+
+def cmd_batch(args):
+    """One row per maze and algorithm, written as it is produced"""
+    algorithms = args.algorithms or list(SOLVERS)
+    out = open(args.out, "w", newline="") if args.out else sys.stdout
+    writer = None
+    try:
+        for width, height in args.size or [(20, 20)]:
+            for maze_type in args.maze_types or [1]:
+                seeds = dataset.job_seeds(args.seed, args.count, width, height, maze_type)
+                for seed in seeds:
+                    maze, elapsed = build_maze(width, height, maze_type, seed)
+                    start, end = endpoints(maze)
+                    solver = MazeSolver(maze)
+                    for name in algorithms:
+                        row = {"width": width, "height": height, "maze_type": maze_type,
+                               "seed": seed, "generate_time": elapsed}
+                        record = solve_record(solver, name, start, end, seed)
+                        record["start"], record["end"] = "%d,%d" % start, "%d,%d" % end
+                        row.update(record)
+                        if args.format == "csv":
+                            if writer is None:
+                                writer = csv.DictWriter(out, fieldnames=list(row))
+                                writer.writeheader()
+                            writer.writerow(row)
+                        else:
+                            out.write(json.dumps(row) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+def cmd_export(args):
+    """Render a search offscreen and write it as PNG frames or raw rgb24 video"""
+    maze, seed = maze_from_args(args)
+    start, end = endpoints_from_args(args, maze)
+    random.seed(seed)
+    result = MazeSolver(maze).solve(args.algorithm, start, end)
+    frames = export.render_frames(maze, result, start, end, args.algorithm,
+                                  args.cells_per_frame, args.cell_size, args.shrink)
+    started = time.perf_counter()
+    fmt = args.format or ("raw" if args.out == "-" or args.out.endswith(".rgb") else "png")
+    if fmt == "png":
+        count = export.export_png(frames, args.out, args.workers)
+        size = None
+    else:
+        count, size = export.export_raw(frames, args.out)
+    elapsed = time.perf_counter() - started
+    record = dict(result.stats)
+    record.update(out=args.out, format=fmt, frames=count, export_time=elapsed,
+                  frames_per_second=count / elapsed if elapsed else None)
+    if size:
+        record["frame_size"] = list(size)
+    # Raw video on stdout leaves the summary to stderr
+    emit(record, sys.stderr if args.out == "-" else sys.stdout)
+
+def cmd_interactive(args):
+    interactive(args.type)
+
+def cmd_replay(args):
+    """Animate a saved search trace over the maze it was recorded on"""
+    from visualizer import MazeVisualizer
+
+    maze = load_maze(args.maze)
+    result = load_result(args.trace)
+    if result.shape != maze.shape:
+        sys.exit(f"{args.trace} was recorded on a {result.shape} maze, not {maze.shape}")
+    cell_size = max(1, 450 // max(maze.shape))
+    visualizer = MazeVisualizer(maze, cell_size=cell_size, maze_size=os.path.basename(args.maze))
+    path = result.path_cells()
+    if len(path):
+        visualizer.start, visualizer.end = tuple(path[0].tolist()), tuple(path[-1].tolist())
+    visualizer.animate_result(result)
+    visualizer.quit()
+
+def emit(record, stream=None):
+    print(json.dumps(record, indent=2), file=stream or sys.stdout)
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Maze generator and solver. Without a command, starts the interactive viewer.")
+    commands = parser.add_subparsers(dest="command")
+
+    def maze_options(command):
+        command.add_argument("--size", type=parse_size, default=(20, 20),
+                             help="maze size in cells, WIDTHxHEIGHT (default 20x20)")
+        command.add_argument("--type", type=int, choices=sorted(MAZE_TYPE_NAMES), default=1,
+                             help="maze type (default 1)")
+        command.add_argument("--seed", type=int, default=None, help="generator seed")
+
+    def algorithm_option(command):
+        command.add_argument("--algorithm", choices=list(SOLVERS), action="append",
+                             dest="algorithms", help="solver to run (repeatable, default all)")
+
+    generate = commands.add_parser("generate", help="generate a maze and save it")
+    maze_options(generate)
+    generate.add_argument("--out", required=True, help="output file, .maze or .npy")
+    generate.set_defaults(func=cmd_generate)
+
+    solve = commands.add_parser("solve", help="solve one maze and print JSON stats")
+    maze_options(solve)
+    solve.add_argument("--maze", help="solve a saved .maze file instead of generating one")
+    algorithm_option(solve)
+    solve.add_argument("--start", type=parse_cell, help="start cell as X,Y")
+    solve.add_argument("--end", type=parse_cell, help="end cell as X,Y")
+    solve.add_argument("--path", action="store_true", help="include the path cells")
+    solve.add_argument("--trace-dir", help="save each search as <solver>.npz for replay")
+    solve.set_defaults(func=cmd_solve, parser=solve)
+
+    batch = commands.add_parser("batch", help="generate and solve many seeded mazes")
+    batch.add_argument("--size", type=parse_size, action="append",
+                       help="maze size in cells, WIDTHxHEIGHT (repeatable, default 20x20)")
+    batch.add_argument("--type", type=int, choices=sorted(MAZE_TYPE_NAMES), action="append",
+                       dest="maze_types", help="maze type (repeatable, default 1)")
+    batch.add_argument("--count", type=int, default=10, help="mazes per size and type")
+    batch.add_argument("--seed", type=int, default=0, help="base seed for the batch")
+    algorithm_option(batch)
+    batch.add_argument("--format", choices=["jsonl", "csv"], default="jsonl",
+                       help="one JSON object per line, or CSV")
+    batch.add_argument("--out", help="output file (default stdout)")
+    batch.set_defaults(func=cmd_batch)
+
+    corpus = commands.add_parser("corpus", help="generate a maze corpus in parallel")
+    dataset.build_parser(corpus).set_defaults(func=dataset.run)
+
+    bench = commands.add_parser("benchmark", help="run the headless benchmark suite")
+    benchmark.build_parser(bench).set_defaults(func=benchmark.run)
+
+    render = commands.add_parser("export", help="render a search animation offscreen")
+    maze_options(render)
+    render.add_argument("--maze", help="use a saved .maze file instead of generating one")
+    render.add_argument("--algorithm", choices=list(SOLVERS), default="BFS", help="solver to animate")
+    render.add_argument("--start", type=parse_cell, help="start cell as X,Y")
+    render.add_argument("--end", type=parse_cell, help="end cell as X,Y")
+    render.add_argument("--out", required=True,
+                        help="directory for PNG frames, or a .rgb file / - for raw rgb24 video")
+    render.add_argument("--format", choices=["png", "raw"], help="default: from --out")
+    render.add_argument("--cells-per-frame", type=int, default=500, help="cells revealed per frame")
+    render.add_argument("--cell-size", type=int, default=1, help="pixels per cell")
+    render.add_argument("--shrink", type=int, default=1,
+                        help="cells per pixel side, max-pooled, for huge mazes")
+    render.add_argument("--workers", type=int, default=None,
+                        help="PNG encoder processes (0 encodes inline)")
+    render.set_defaults(func=cmd_export, parser=render)
+
+    play = commands.add_parser("interactive", help="open the visualizer (the default)")
+    play.add_argument("--type", type=int, choices=[1, 2], help="maze type, skips the prompt")
+    play.set_defaults(func=cmd_interactive)
+
+    replay = commands.add_parser("replay", help="animate a search saved by solve --trace-dir")
+    replay.add_argument("--maze", required=True, help="the .maze file the search ran on")
+    replay.add_argument("--trace", required=True, help="the saved .npz search trace")
+    replay.set_defaults(func=cmd_replay)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        return interactive()
+    return args.func(args)
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
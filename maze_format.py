@@ -0,0 +1,85 @@
+import struct
+
+import numpy as np
+
+# File layout: a fixed 64-byte header followed by the wall grid bit-packed
+# row by row (1 = wall), each row padded to whole bytes so any tile can be
+# unpacked on its own straight from the memory map.
+MAGIC = b"MAZ1"
+HEADER = struct.Struct("<4sIIBBqiiii")
+HEADER_SIZE = 64
+HAS_SEED = 1
+HAS_ENDPOINTS = 2
+TILE = 256
+
+def save_maze(path, maze, maze_type=0, seed=None, start=None, end=None, chunk_rows=4096):
+    """Write maze as a bit-packed .maze file; works chunk-wise on memmapped input"""
+    rows, cols = maze.shape
+    flags = (HAS_SEED if seed is not None else 0) | (HAS_ENDPOINTS if start and end else 0)
+    sx, sy = start if start else (0, 0)
+    ex, ey = end if end else (0, 0)
+    header = HEADER.pack(MAGIC, rows, cols, maze_type, flags, seed or 0, sx, sy, ex, ey)
+    with open(path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        for y in range(0, rows, chunk_rows):
+            f.write(np.packbits(np.asarray(maze[y:y + chunk_rows]) != 0, axis=1).tobytes())
+
+def load_maze(path):
+    """Memory-map a .maze file; nothing is unpacked until cells are read"""
+    return PackedMaze(path)
+
+class PackedMaze:
+    """Read-only, lazily unpacked view of a .maze file
+
+    Indexing with two slices unpacks just that region, and np.asarray()
+    unpacks the whole grid, so MazeSolver and MazeVisualizer take it as-is.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            fields = HEADER.unpack(f.read(HEADER.size))
+        magic, rows, cols, maze_type, flags, seed, sx, sy, ex, ey = fields
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a maze file")
+        self.path = path
+        self.shape = (rows, cols)
+        self.maze_type = maze_type
+        self.seed = seed if flags & HAS_SEED else None
+        self.start = (sx, sy) if flags & HAS_ENDPOINTS else None
+        self.end = (ex, ey) if flags & HAS_ENDPOINTS else None
+        self.bits = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER_SIZE,
+                              shape=(rows, (cols + 7) // 8))
+
+    def read(self, y0, y1, x0, x1):
+        """Unpack rows y0:y1 and columns x0:x1 into a uint8 wall grid"""
+        packed = self.bits[y0:y1, x0 // 8:(x1 + 7) // 8]
+        cells = np.unpackbits(packed, axis=1)
+        return cells[:, x0 % 8:x0 % 8 + (x1 - x0)]
+
+    def tiles(self, size=TILE):
+        """Yield (y, x, tile) for every size x size block of the grid"""
+        rows, cols = self.shape
+        for y in range(0, rows, size):
+            for x in range(0, cols, size):
+                yield y, x, self.read(y, min(y + size, rows), x, min(x + size, cols))
+
+    def __getitem__(self, key):
+        rows, cols = self.shape
+        ys, xs = key
+        if not isinstance(ys, slice):
+            ys = int(ys) % rows
+        if not isinstance(xs, slice):
+            xs = int(xs) % cols
+        if isinstance(ys, int) and isinstance(xs, int):
+            return int(self.read(ys, ys + 1, xs, xs + 1)[0, 0])
+        if isinstance(ys, int):
+            return self[ys:ys + 1, xs][0]
+        if isinstance(xs, int):
+            return self[ys, xs:xs + 1][:, 0]
+        y0, y1, ystep = ys.indices(rows)
+        x0, x1, xstep = xs.indices(cols)
+        return self.read(y0, max(y0, y1), x0, max(x0, x1))[::ystep, ::xstep]
+
+    def __array__(self, dtype=None, copy=None):
+        cells = self.read(0, self.shape[0], 0, self.shape[1])
+        return cells if dtype is None else cells.astype(dtype)
@@ -2,9 +2,12 @@ import numpy as np
 import random
 
 class MazeGenerator:
-    def __init__(self, width, height):
+    def __init__(self, width, height, seed=None):
         self.width = width
         self.height = height
+        # Per-instance RNG: the same seed always rebuilds the same maze
+        self.seed = seed
+        self.rng = random.Random(seed)
     
     def generate_recursive_backtracking(self):
         """Generate perfect maze with recursive backtracking (single shortest path)"""
@@ -17,7 +20,7 @@ class MazeGenerator:
         while stack:
             x, y = stack[-1]
             directions = [(1,0),(0,1),(-1,0),(0,-1)]
-            random.shuffle(directions)
+            self.rng.shuffle(directions)
             
             found = False
             for dx, dy in directions:
@@ -33,34 +36,116 @@ class MazeGenerator:
                 stack.pop()
         return maze
 
-    def generate_multi_path_maze(self):
+    def removable_walls(self, maze):
         """
-        Start with a perfect maze, then randomly knock out walls to create loops
-        so multiple paths exist between start/end, but overall structure/density is preserved.
+        Boolean mask of wall cells that sit between two open cells, in line
+        horizontally or vertically. Knocking any of them out adds a loop.
         """
-        maze = self.generate_recursive_backtracking()
         h, w = maze.shape
-        attempts = max(10, (h * w) // 15)  # More attempts for bigger mazes
-        
-        for _ in range(attempts):
-            x = random.randrange(1, w - 1, 2)
-            y = random.randrange(1, h - 1, 2)
-            # Try knocking down a wall adjacent to two paths
-            directions = [(1,0), (-1,0), (0,1), (0,-1)]
-            random.shuffle(directions)
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                fx, fy = x + 2*dx, y + 2*dy
-                if 0 < nx < w-1 and 0 < ny < h-1 and 0 < fx < w-1 and 0 < fy < h-1:
-                    # Only add loop if both end cells are path and the wall is closed:
-                    if maze[ny, nx] == 1 and maze[fy, fx] == 0 and maze[y, x] == 0:
-                        maze[ny, nx] = 0
-                        break  # don't over-collapse this spot
+        is_open = maze == 0
+        mask = np.zeros((h, w), dtype=bool)
+        inner = maze[1:-1, 1:-1] == 1
+        across = is_open[1:-1, :-2] & is_open[1:-1, 2:]
+        down = is_open[:-2, 1:-1] & is_open[2:, 1:-1]
+        mask[1:-1, 1:-1] = inner & (across | down)
+        # Keep to the cell lattice: walls between cells have one odd and one
+        # even coordinate, so pillars at (even, even) are never opened.
+        ys, xs = np.ogrid[:h, :w]
+        mask &= (ys % 2) != (xs % 2)
+        return mask
+
+    def generate_multi_path_maze(self, loop_ratio=0.27):
+        """
+        Start with a perfect maze, then knock out a loop_ratio fraction of
+        its removable walls in one vectorized draw, so multiple paths exist
+        between start/end while overall structure/density is preserved.
+        The default matches the density of the old random-attempt loop.
+        """
+        maze = self.generate_recursive_backtracking()
+        candidates = np.flatnonzero(self.removable_walls(maze))
+        count = int(round(loop_ratio * candidates.size))
+        if count:
+            rng = np.random.default_rng(self.rng.getrandbits(64))
+            maze.flat[rng.choice(candidates, size=count, replace=False)] = 0
+        return maze
 
+    def generate_eller_rows(self):
+        """
+        Stream a perfect maze one grid row at a time with Eller's algorithm.
+        Only the current row's set membership is kept, so working memory is
+        O(width); yields the (width*2+1)-long uint8 rows top to bottom.
+        """
+        w = self.width
+        cols = w * 2 + 1
+        yield np.ones(cols, dtype=np.uint8)
+
+        sets = list(range(w))
+        next_id = w
+        for y in range(self.height):
+            last = y == self.height - 1
+            row = np.ones(cols, dtype=np.uint8)
+            row[1::2] = 0
+
+            # Join neighbours from different sets; the last row joins them all
+            merged = {}
+            def find(s):
+                root = s
+                while root in merged:
+                    root = merged[root]
+                while s != root:
+                    merged[s], s = root, merged[s]
+                return root
+            joined = []
+            for x in range(w - 1):
+                a, b = find(sets[x]), find(sets[x + 1])
+                if a != b and (last or self.rng.random() < 0.5):
+                    merged[b] = a
+                    joined.append(x * 2 + 2)
+            row[joined] = 0
+            sets = [find(s) for s in sets]
+            yield row
+
+            below = np.ones(cols, dtype=np.uint8)
+            if last:
+                yield below
+                break
+
+            # Every set carries on downwards through at least one cell
+            members = {}
+            for x, s in enumerate(sets):
+                members.setdefault(s, []).append(x)
+            carried = [False] * w
+            for xs in members.values():
+                self.rng.shuffle(xs)
+                for x in xs[:self.rng.randint(1, len(xs))]:
+                    carried[x] = True
+            for x in range(w):
+                if not carried[x]:
+                    sets[x] = next_id
+                    next_id += 1
+            below[1::2][carried] = 0
+            yield below
+
+    def generate_eller(self):
+        """Generate perfect maze with Eller's algorithm (row-streamed, uint8)"""
+        return np.vstack(list(self.generate_eller_rows()))
+
+    def write_memmap(self, path):
+        """
+        Stream an Eller maze straight into a uint8 .npy memmap at path, so the
+        full grid never has to fit in RAM. Reopen with np.load(path, mmap_mode='r').
+        """
+        shape = (self.height * 2 + 1, self.width * 2 + 1)
+        maze = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=shape)
+        for y, row in enumerate(self.generate_eller_rows()):
+            maze[y] = row
+        maze.flush()
         return maze
 
     def get_maze(self, maze_type=1):
         if maze_type == 2:
             return self.generate_multi_path_maze()
+        elif maze_type == 3:
+            return self.generate_eller()
         else:
             return self.generate_recursive_backtracking()
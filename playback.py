@@ -0,0 +1,157 @@
+import time
+
+import numpy as np
+
+from algorithms import EXPAND, PATH
+
+class ListTrace:
+    """A finished search, given as flat int32 explored and path indices
+
+    The arrays are kept as they are (e.g. a SearchResult's read-only
+    arrays); only the slice being painted is turned into (x, y) cells.
+    """
+
+    complete = True
+
+    def __init__(self, explored, path, cols):
+        self.explored = explored
+        self.path = path
+        self.cols = cols
+
+    @property
+    def explored_count(self):
+        return len(self.explored)
+
+    def pull(self, needed):
+        pass
+
+    def cells(self, indices):
+        ys, xs = np.divmod(indices, self.cols)
+        return np.stack([xs, ys], axis=1)
+
+    def explored_cells(self, first, last):
+        return self.cells(self.explored[first:last])
+
+    def path_cells(self, first, last):
+        return self.cells(self.path[first:last])
+
+class StreamTrace:
+    """A search still running: step events are pulled lazily as playback needs them
+
+    The source is anything with poll() returning a batch of events, [] when
+    none is ready yet, or None when the search is over, such as a background
+    SolverWorker. Explored cells are kept as flat int32 indices in one
+    preallocated buffer rather than a list of tuples, and pulling stops
+    after a small time budget so the UI keeps its frame rate.
+    """
+
+    def __init__(self, source, shape, budget=0.008):
+        self.source = source
+        self.cols = shape[1]
+        self.order = np.empty(shape[0] * shape[1], dtype=np.int32)
+        self.explored_count = 0
+        self.path = []
+        self.complete = False
+        self.budget = budget
+
+    def pull(self, needed):
+        """Consume events until `needed` cells are explored, the stream ends or time is up"""
+        deadline = time.perf_counter() + self.budget
+        while not self.complete and self.explored_count < needed:
+            batch = self.source.poll()
+            if batch is None:
+                self.complete = True
+                break
+            if not batch:
+                break
+            for kind, payload in batch:
+                if kind == EXPAND:
+                    x, y = payload
+                    self.order[self.explored_count] = y * self.cols + x
+                    self.explored_count += 1
+                elif kind == PATH:
+                    self.path = payload
+            if time.perf_counter() > deadline:
+                break
+
+    def explored_cells(self, first, last):
+        ys, xs = np.divmod(self.order[first:min(last, self.explored_count)], self.cols)
+        return np.stack([xs, ys], axis=1)
+
+    def path_cells(self, first, last):
+        return self.path[first:last]
+
+class Playback:
+    """Timeline over a solver's explored order followed by its final path
+
+    The position is a float step count advanced by wall-clock time, so one
+    frame can reveal any number of cells. Playback can be paused, sped up
+    or slowed down, and scrubbed to any step.
+    """
+
+    SPEEDS = (0.25, 0.5, 1, 2, 4, 8, 16, 32, 64)
+
+    def __init__(self, explored_count, path_count, duration=10.0, min_rate=15):
+        self.set_counts(explored_count, path_count)
+        # At 1x the whole run plays in `duration` seconds, but small runs never
+        # go slower than the classic one cell per frame at 15 fps.
+        self.base_rate = max(min_rate, self.total / duration)
+        self.speed = 1
+        self.position = 0.0
+        self.paused = False
+
+    def set_counts(self, explored_count, path_count, complete=True):
+        """Update the timeline length; incomplete timelines are still growing"""
+        self.explored_count = explored_count
+        self.path_count = path_count
+        self.total = explored_count + path_count
+        self.complete = complete
+
+    @property
+    def step(self):
+        return int(self.position)
+
+    @property
+    def finished(self):
+        return self.complete and self.step >= self.total
+
+    @property
+    def phase(self):
+        if self.finished:
+            return "COMPLETE"
+        if self.step < self.explored_count or not self.complete:
+            return "EXPLORING"
+        return "BUILDING PATH"
+
+    @property
+    def fraction(self):
+        return self.position / self.total if self.total else 1.0
+
+    def split(self, step=None):
+        """(explored cells shown, path cells shown) at step, default the current one"""
+        step = self.step if step is None else step
+        return min(step, self.explored_count), max(0, step - self.explored_count)
+
+    def update(self, dt):
+        """Advance by dt seconds of wall-clock time; returns the new step"""
+        if not self.paused and not self.finished:
+            rate = self.base_rate * self.speed
+            self.position = min(float(self.total), self.position + dt * rate)
+        return self.step
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+
+    def faster(self):
+        faster = [s for s in self.SPEEDS if s > self.speed]
+        self.speed = faster[0] if faster else self.speed
+
+    def slower(self):
+        slower = [s for s in self.SPEEDS if s < self.speed]
+        self.speed = slower[-1] if slower else self.speed
+
+    def seek(self, step):
+        self.position = float(max(0, min(self.total, step)))
+
+    def seek_fraction(self, fraction):
+        self.seek(round(fraction * self.total))
@@ -0,0 +1,83 @@
+import json
+
+import numpy as np
+
+class SearchResult:
+    """Immutable outcome of one search, backed by int32 arrays
+
+    Cells are flat indices y * cols + x into the maze, 4 bytes each:
+    `explored` is the expansion order, `path` runs from start to end (empty
+    when there is none) and `parent`, when kept, is the search tree with one
+    entry per cell (-1 where there is no parent). `levels`, from
+    level-synchronous searches, holds where each BFS level starts in
+    `explored`, with the total at the end. The arrays are read-only,
+    so slices are safe zero-copy views. Unpacking gives (path, explored) as
+    (n, 2) arrays of (x, y), the shape the solvers used to return as lists.
+    """
+
+    __slots__ = ("shape", "explored", "path", "parent", "stats", "levels")
+
+    def __init__(self, shape, explored, path, parent=None, stats=None, levels=None):
+        set_field = object.__setattr__
+        set_field(self, "shape", (int(shape[0]), int(shape[1])))
+        for name, array in (("explored", explored), ("path", path), ("parent", parent),
+                            ("levels", levels)):
+            if array is not None:
+                array = np.array(array, dtype=np.int32)
+                array.flags.writeable = False
+            set_field(self, name, array)
+        set_field(self, "stats", dict(stats or {}))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SearchResult is immutable")
+
+    def __reduce__(self):
+        return SearchResult, (self.shape, self.explored, self.path, self.parent, self.stats,
+                              self.levels)
+
+    def __iter__(self):
+        return iter((self.path_cells(), self.explored_cells()))
+
+    @property
+    def found(self):
+        return len(self.path) > 0
+
+    @property
+    def algorithm(self):
+        return self.stats.get("algorithm")
+
+    def cells(self, indices):
+        """(n, 2) int32 array of (x, y) for flat indices"""
+        ys, xs = np.divmod(indices, self.shape[1])
+        return np.stack([xs, ys], axis=1)
+
+    def explored_cells(self, first=0, last=None):
+        return self.cells(self.explored[first:last])
+
+    def level(self, k):
+        """Flat indices of BFS level k, for results that carry levels"""
+        return self.explored[self.levels[k]:self.levels[k + 1]]
+
+    def path_cells(self):
+        return self.cells(self.path)
+
+    def nbytes(self):
+        arrays = [self.explored, self.path, self.parent, self.levels]
+        return sum(array.nbytes for array in arrays if array is not None)
+
+def save_result(path, result):
+    """Write a SearchResult as a compressed .npz"""
+    arrays = {"shape": np.array(result.shape, dtype=np.int64),
+              "explored": result.explored, "path": result.path,
+              "stats": np.array(json.dumps(result.stats))}
+    for name in ("parent", "levels"):
+        if getattr(result, name) is not None:
+            arrays[name] = getattr(result, name)
+    np.savez_compressed(path, **arrays)
+
+def load_result(path):
+    with np.load(path) as data:
+        optional = {name: data[name] if name in data.files else None
+                    for name in ("parent", "levels")}
+        return SearchResult(data["shape"], data["explored"], data["path"], optional["parent"],
+                            json.loads(str(data["stats"])), optional["levels"])
@@ -0,0 +1,24 @@
+class CellType:
+    WALL = (20, 20, 20)
+    PATH = (255, 255, 255)
+    EXPLORED_DFS = (100, 150, 255)
+    EXPLORED_BFS = (255, 180, 100)
+    EXPLORED_ASTAR = (180, 120, 220)
+    EXPLORED_BIBFS = (120, 200, 190)
+    FINAL_PATH = (34, 177, 76)
+    START = (66, 133, 244)
+    END = (219, 68, 55)
+
+# Per-algorithm exploration colour, frame colour and strategy blurb
+ALGORITHM_STYLES = {
+    "DFS": (CellType.EXPLORED_DFS, (50, 100, 200), "Go DEEP (Stack)"),
+    "BFS": (CellType.EXPLORED_BFS, (200, 100, 50), "Go BROAD (Queue)"),
+    "A*": (CellType.EXPLORED_ASTAR, (120, 60, 170), "Go TOWARDS GOAL (Heap)"),
+    "BI-BFS": (CellType.EXPLORED_BIBFS, (40, 140, 130), "Go BROAD FROM BOTH ENDS"),
+}
+
+def state_palette(color_type=None):
+    """Colours for cell states: path, wall, explored, final path, start, end"""
+    explored = ALGORITHM_STYLES.get(color_type, ALGORITHM_STYLES["BFS"])[0]
+    return [CellType.PATH, CellType.WALL, explored,
+            CellType.FINAL_PATH, CellType.START, CellType.END]
@@ -0,0 +1,211 @@
+from collections import OrderedDict
+import math
+
+import numpy as np
+import pygame
+
+def max_pool(grid):
+    """Halve a state grid, each cell keeping the highest value of its 2x2 block"""
+    h, w = grid.shape
+    if h % 2 or w % 2:
+        grid = np.pad(grid, ((0, h % 2), (0, w % 2)))
+    return np.maximum(np.maximum(grid[0::2, 0::2], grid[0::2, 1::2]),
+                      np.maximum(grid[1::2, 0::2], grid[1::2, 1::2]))
+
+class Viewport:
+    """Pan-and-zoom camera over a maze state grid, drawn from cached tiles
+
+    The state grid holds a palette index per cell. Zoomed in, every cell is a
+    whole number of pixels; zoomed out, a pixel stands for a 2^level block of
+    cells taken from a max-pooled copy of the grid, so walls and search
+    colours (the higher palette indices) stay visible over open floor. Tiles
+    are rendered once per zoom level and kept in an LRU cache; marking cells
+    only re-renders the tiles they fall in.
+    """
+
+    ZOOMS = (1 / 64, 1 / 32, 1 / 16, 1 / 8, 1 / 4, 1 / 2, 1, 2, 3, 4, 6, 8, 12, 16, 24, 32)
+    TILE_PIXELS = 256
+
+    def __init__(self, state, palette, size, scale=1, background=(248, 248, 248),
+                 max_tiles=256):
+        self.width, self.height = size
+        self.background = background
+        self.max_tiles = max_tiles
+        self.palette = np.asarray(palette, dtype=np.uint8)
+        self.tiles = OrderedDict()
+        self.stale = set()
+        self.set_state(state)
+        self.center_x = self.cols / 2
+        self.center_y = self.rows / 2
+        self.set_scale(scale)
+
+    def set_state(self, state):
+        """Replace the whole state grid; the pyramid and tile cache start over"""
+        self.levels = [state]
+        self.rows, self.cols = state.shape
+        self.tiles.clear()
+        self.stale.clear()
+
+    def set_palette(self, palette):
+        palette = np.asarray(palette, dtype=np.uint8)
+        if not np.array_equal(palette, self.palette):
+            self.palette = palette
+            self.tiles.clear()
+
+    def set_scale(self, scale):
+        """Zoom to `scale` pixels per cell: whole pixels, or 1 / 2^level zoomed out"""
+        self.scale = scale
+        self.level = max(0, round(-math.log2(scale))) if scale < 1 else 0
+        self.cell_px = max(1, int(scale))
+        self.tile_cells = max(8, self.TILE_PIXELS // self.cell_px)
+        self.tile_px = self.tile_cells * self.cell_px
+        self.tiles.clear()
+        self.stale.clear()
+        self._clamp()
+
+    def grid(self, level=None):
+        """State grid at a pyramid level, pooling it from the level below on first use"""
+        level = self.level if level is None else level
+        while len(self.levels) <= level:
+            self.levels.append(max_pool(self.levels[-1]))
+        return self.levels[level]
+
+    def content_size(self):
+        rows, cols = self.grid().shape
+        return cols * self.cell_px, rows * self.cell_px
+
+    def fit_scale(self, largest=None):
+        """Largest zoom step (up to `largest`) that shows the whole maze"""
+        largest = largest or self.ZOOMS[-1]
+        fits = [s for s in sorted(set(self.ZOOMS) | {largest}) if s <= largest
+                and self.cols * s <= self.width and self.rows * s <= self.height]
+        return fits[-1] if fits else self.ZOOMS[0]
+
+    def offset(self):
+        """Pixel position of the view's top-left corner in the zoomed content"""
+        content_w, content_h = self.content_size()
+        scale = self.cell_px / 2 ** self.level
+        offsets = []
+        for center, view, content in ((self.center_x, self.width, content_w),
+                                      (self.center_y, self.height, content_h)):
+            if content <= view:
+                offsets.append(-((view - content) // 2))
+            else:
+                offsets.append(min(max(0, round(center * scale - view / 2)), content - view))
+        return offsets
+
+    def _clamp(self):
+        scale = self.cell_px / 2 ** self.level
+        half_w, half_h = self.width / 2 / scale, self.height / 2 / scale
+        self.center_x = min(max(self.center_x, half_w), max(half_w, self.cols - half_w))
+        self.center_y = min(max(self.center_y, half_h), max(half_h, self.rows - half_h))
+
+    def pan(self, dx, dy):
+        """Move the content by (dx, dy) screen pixels"""
+        scale = self.cell_px / 2 ** self.level
+        self.center_x -= dx / scale
+        self.center_y -= dy / scale
+        self._clamp()
+
+    def zoom(self, steps, anchor=None):
+        """Step through ZOOMS, keeping the cell under anchor (view pixels) in place"""
+        if steps > 0:
+            choices = [s for s in self.ZOOMS if s > self.scale]
+            scale = choices[min(steps, len(choices)) - 1] if choices else self.scale
+        else:
+            choices = [s for s in self.ZOOMS if s < self.scale]
+            scale = choices[max(steps, -len(choices))] if choices else self.scale
+        if scale == self.scale:
+            return False
+        ax, ay = anchor if anchor else (self.width // 2, self.height // 2)
+        cell_x, cell_y = self.cell_at((ax, ay), clamp=False)
+        self.set_scale(scale)
+        self.center_x = cell_x + (self.width / 2 - ax) / scale
+        self.center_y = cell_y + (self.height / 2 - ay) / scale
+        self._clamp()
+        return True
+
+    def cell_at(self, pos, clamp=True):
+        """Maze cell (x, y) under a view pixel; floats unless clamped to the grid"""
+        x0, y0 = self.offset()
+        scale = self.cell_px / 2 ** self.level
+        x, y = (x0 + pos[0]) / scale, (y0 + pos[1]) / scale
+        if clamp:
+            return min(max(int(x), 0), self.cols - 1), min(max(int(y), 0), self.rows - 1)
+        return x, y
+
+    def mark(self, xs, ys, value):
+        """Raise cells to palette index `value` on every built level; their tiles go stale"""
+        for level, grid in enumerate(self.levels):
+            gy, gx = ys >> level, xs >> level
+            grid[gy, gx] = np.maximum(grid[gy, gx], value)
+        self._touch(xs, ys)
+
+    def set_cells(self, xs, ys, values):
+        """
+        Overwrite cells, which unlike mark() may lower them (a wall opened,
+        a path moved). Pooled levels are recomputed from their 2x2 blocks.
+        """
+        self.levels[0][ys, xs] = values
+        gy, gx = ys, xs
+        for level in range(1, len(self.levels)):
+            below = self.levels[level - 1]
+            h, w = below.shape
+            gy, gx = gy >> 1, gx >> 1
+            y0, x0 = gy * 2, gx * 2
+            y1, x1 = np.minimum(y0 + 1, h - 1), np.minimum(x0 + 1, w - 1)
+            self.levels[level][gy, gx] = np.maximum(np.maximum(below[y0, x0], below[y0, x1]),
+                                                    np.maximum(below[y1, x0], below[y1, x1]))
+        self._touch(xs, ys)
+
+    def _touch(self, xs, ys):
+        ty = (ys >> self.level) // self.tile_cells
+        tx = (xs >> self.level) // self.tile_cells
+        for key in set(zip(ty.tolist(), tx.tolist())):
+            self.tiles.pop(key, None)
+            self.stale.add(key)
+
+    def tile(self, ty, tx):
+        key = (ty, tx)
+        surface = self.tiles.pop(key, None)
+        if surface is None:
+            size = self.tile_cells
+            block = self.grid()[ty * size:(ty + 1) * size, tx * size:(tx + 1) * size]
+            surface = pygame.surfarray.make_surface(self.palette[block].swapaxes(0, 1))
+            if self.cell_px != 1:
+                surface = pygame.transform.scale(surface, (block.shape[1] * self.cell_px,
+                                                           block.shape[0] * self.cell_px))
+        self.tiles[key] = surface
+        if len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+        return surface
+
+    def draw(self, target, origin, full=True):
+        """
+        Blit the visible tiles with the view's top-left at origin. Unless full,
+        only tiles marked since the last draw are blitted. Returns the screen
+        rects drawn.
+        """
+        view = pygame.Rect(origin, (self.width, self.height))
+        x0, y0 = self.offset()
+        rows, cols = self.grid().shape
+        first_tx, first_ty = max(0, x0 // self.tile_px), max(0, y0 // self.tile_px)
+        last_tx = min((cols - 1) // self.tile_cells, (x0 + self.width - 1) // self.tile_px)
+        last_ty = min((rows - 1) // self.tile_cells, (y0 + self.height - 1) // self.tile_px)
+        clip = target.get_clip()
+        target.set_clip(view)
+        rects = []
+        if full:
+            target.fill(self.background, view)
+            rects.append(view)
+        for ty in range(first_ty, last_ty + 1):
+            for tx in range(first_tx, last_tx + 1):
+                if not full and (ty, tx) not in self.stale:
+                    continue
+                position = (view.x + tx * self.tile_px - x0, view.y + ty * self.tile_px - y0)
+                rect = target.blit(self.tile(ty, tx), position)
+                if not full:
+                    rects.append(rect)
+        target.set_clip(clip)
+        self.stale.clear()
+        return rects
@@ -1,14 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+import numpy as np
 import pygame
 import random
 
-class CellType:
-    WALL = (20, 20, 20)
-    PATH = (255, 255, 255)
-    EXPLORED_DFS = (100, 150, 255)
-    EXPLORED_BFS = (255, 180, 100)
-    FINAL_PATH = (34, 177, 76)
-    START = (66, 133, 244)
-    END = (219, 68, 55)
+from algorithms import label_components
+from playback import ListTrace, Playback, StreamTrace
+from styles import ALGORITHM_STYLES, CellType, state_palette
+from viewport import Viewport
+from worker import SolverWorker, race_job
 
 class Button:
     def __init__(self, x, y, width, height, text, color, text_color):
@@ -36,182 +37,399 @@ class Button:
 
 class MazeVisualizer:
     def __init__(self, maze, cell_size=1, maze_size="MEDIUM"):
-        self.maze = maze
+        self.maze = np.asarray(maze)
         self.cell_size = cell_size
         self.rows, self.cols = maze.shape
         self.maze_size = maze_size
 
         pygame.init()
-        self.maze_width = self.cols * cell_size
-        self.maze_height = self.rows * cell_size
-
         self.window_width = 800
         self.window_height = 700
 
+        # Mazes too big for the window get a pan-and-zoom view of this size
+        self.maze_width = min(self.cols * cell_size, self.window_width - 40)
+        self.maze_height = min(self.rows * cell_size, 450)
+
         self.screen = pygame.display.set_mode((self.window_width, self.window_height))
         pygame.display.set_caption(f"Maze Solver - DFS vs BFS ({maze_size})")
         self.clock = pygame.time.Clock()
         self.maze_x = (self.window_width - self.maze_width) // 2
         self.maze_y = 15
 
-        button_width = (self.window_width - 50) // 2
-        button_height = 40
         button_spacing_x = 10
         button_spacing_y = 8
+        button_width = (self.window_width - 40 - 2 * button_spacing_x) // 3
+        button_height = 40
         start_x = 20
         start_y = self.maze_y + self.maze_height + 20
+        col_x = [start_x + c * (button_width + button_spacing_x) for c in range(3)]
+        row_y = [start_y + r * (button_height + button_spacing_y) for r in range(3)]
 
-        self.new_maze_button = Button(start_x, start_y, button_width, button_height, 
+        self.new_maze_button = Button(col_x[0], row_y[0], button_width, button_height, 
                                      "NEW MAZE", (76, 175, 80), (255, 255, 255))
-        self.dfs_button = Button(start_x + button_width + button_spacing_x, start_y, 
-                                button_width, button_height, 
+        self.dfs_button = Button(col_x[1], row_y[0], button_width, button_height, 
                                 "RUN DFS", (100, 150, 200), (255, 255, 255))
-        self.bfs_button = Button(start_x, start_y + button_height + button_spacing_y, 
-                                button_width, button_height, 
+        self.bfs_button = Button(col_x[2], row_y[0], button_width, button_height, 
                                 "RUN BFS", (150, 100, 200), (255, 255, 255))
-        self.compare_button = Button(start_x + button_width + button_spacing_x, 
-                                    start_y + button_height + button_spacing_y, 
-                                    button_width, button_height, 
+        self.astar_button = Button(col_x[0], row_y[1], button_width, button_height, 
+                                  "RUN A*", (120, 60, 170), (255, 255, 255))
+        self.bibfs_button = Button(col_x[1], row_y[1], button_width, button_height, 
+                                  "RUN BI-BFS", (40, 140, 130), (255, 255, 255))
+        self.compare_button = Button(col_x[2], row_y[1], button_width, button_height, 
                                     "COMPARE", (255, 152, 0), (255, 255, 255))
-        self.exit_button = Button(start_x, start_y + 2 * (button_height + button_spacing_y), 
+        self.race_button = Button(col_x[0], row_y[2], 
                                  2 * button_width + button_spacing_x, button_height, 
+                                 "RACE DFS vs BFS", (0, 150, 136), (255, 255, 255))
+        self.exit_button = Button(col_x[2], row_y[2], button_width, button_height, 
                                  "EXIT", (244, 67, 54), (255, 255, 255))
+        self.solver_buttons = {
+            "DFS": self.dfs_button,
+            "BFS": self.bfs_button,
+            "A*": self.astar_button,
+            "BI-BFS": self.bibfs_button,
+        }
+        self.buttons = [self.new_maze_button, self.dfs_button, self.bfs_button,
+                        self.astar_button, self.bibfs_button, self.compare_button,
+                        self.race_button, self.exit_button]
+        self.buttons_rect = self.buttons[0].rect.unionall([b.rect for b in self.buttons[1:]])
         self.stats_y = start_y + 3 * (button_height + button_spacing_y) + 10
-        self.start = None
-        self.end = None
-        self.get_random_start_end()
+        self.progress_rect = pygame.Rect(self.maze_x, self.maze_y + self.maze_height + 8,
+                                         self.maze_width, 6)
+        # Mazes loaded from a .maze file may carry their own start/end
+        self.start = getattr(maze, "start", None)
+        self.end = getattr(maze, "end", None)
+        if self.start is None or self.end is None:
+            self.get_random_start_end()
+        self.wall_state = (self.maze != 0).astype(np.uint8)
+        self.view = Viewport(self.wall_state.copy(), self.palette(None),
+                             (self.maze_width, self.maze_height))
+        self.view.set_scale(self.view.fit_scale(cell_size))
+        self.view_clean = False
+        self.dragging = False
 
     def get_random_start_end(self):
-        paths = []
-        for y in range(self.rows):
-            for x in range(self.cols):
-                if self.maze[y, x] == 0:
-                    paths.append((x, y))
-        if len(paths) > 2:
-            random.shuffle(paths)
-            self.start = paths[0]
-            self.end = paths[-1]
+        """Pick start and end from the same connected region, so a path always exists"""
+        labels = label_components(self.maze).ravel()
+        sizes = np.bincount(labels[labels >= 0])
+        sizes[sizes <= 2] = 0
+        if sizes.any():
+            # A region is picked with odds by size, as if picking a random open cell
+            totals = np.cumsum(sizes)
+            region = int(np.searchsorted(totals, random.randrange(int(totals[-1])), side="right"))
+            cells = np.flatnonzero(labels == region)
+            first = random.randrange(len(cells))
+            second = random.randrange(len(cells) - 1)
+            second += second >= first
+            self.start = tuple(int(v) for v in divmod(int(cells[first]), self.cols)[::-1])
+            self.end = tuple(int(v) for v in divmod(int(cells[second]), self.cols)[::-1])
         else:
             self.start = (1, 1)
             self.end = (self.cols - 2, self.rows - 2)
 
+    def mark_cells(self, state, cells, value):
+        if len(cells):
+            xs, ys = np.asarray(cells, dtype=np.int64).T
+            state[ys, xs] = value
+
+    def paint_cells(self, cells, value):
+        """Raise cells to a palette index and redraw just their tiles; returns the dirty rects"""
+        if not len(cells):
+            return []
+        xs, ys = np.asarray(cells, dtype=np.int64).T
+        self.view.mark(xs, ys, value)
+        self.view_clean = False
+        return self.view.draw(self.screen, (self.maze_x, self.maze_y), full=False)
+
+    def toggle_wall(self, solver, cell):
+        """
+        Flip the wall at cell and let the solver repair its plan with LPA*.
+        The outer border, start and end stay fixed. Returns the new
+        SearchResult, or None if the cell can't be edited.
+        """
+        x, y = cell
+        if (not 0 < x < self.cols - 1 or not 0 < y < self.rows - 1
+                or cell == self.start or cell == self.end):
+            return None
+        wall = 0 if self.wall_state[y, x] else 1
+        solver.set_wall(cell, wall)
+        self.maze[y, x] = wall
+        self.wall_state[y, x] = wall
+        self.view.set_cells(np.array([x]), np.array([y]), wall)
+        self.view_clean = False
+        return solver.replan(self.start, self.end)
+
+    def show_plan(self, plan, previous=None):
+        """Swap the drawn path from previous to plan's, touching only the cells that changed"""
+        old = previous.path_cells() if previous is not None else np.empty((0, 2), dtype=np.int32)
+        new = plan.path_cells()
+        fixed = {self.start, self.end}
+        keep = set(map(tuple, new.tolist()))
+        cleared = [c for c in map(tuple, old.tolist()) if c not in keep and c not in fixed]
+        if cleared:
+            xs, ys = np.array(cleared).T
+            self.view.set_cells(xs, ys, self.wall_state[ys, xs])
+        if len(new):
+            xs, ys = new.T
+            self.view.set_cells(xs, ys, np.maximum(self.view.levels[0][ys, xs], 3))
+        self.view_clean = False
+        return self.view.draw(self.screen, (self.maze_x, self.maze_y), full=False)
+
+    def palette(self, color_type):
+        return state_palette(color_type)
+
+    def draw_view(self):
+        """Redraw the visible part of the maze; returns its screen rect"""
+        return self.view.draw(self.screen, (self.maze_x, self.maze_y))[0]
+
+    def handle_view_event(self, event):
+        """
+        Zoom with the mouse wheel or +/-, 0 to fit, and pan by dragging the
+        maze. Returns True when the view moved and needs a redraw.
+        """
+        view_rect = pygame.Rect(self.maze_x, self.maze_y, self.maze_width, self.maze_height)
+        if event.type == pygame.MOUSEWHEEL:
+            mouse = pygame.mouse.get_pos()
+            if view_rect.collidepoint(mouse):
+                return self.view.zoom(event.y, (mouse[0] - self.maze_x, mouse[1] - self.maze_y))
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.dragging = view_rect.collidepoint(event.pos)
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.dragging = False
+        elif event.type == pygame.MOUSEMOTION and self.dragging:
+            self.view.pan(*event.rel)
+            return True
+        elif event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                return self.view.zoom(1)
+            if event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                return self.view.zoom(-1)
+            if event.key == pygame.K_0:
+                self.view.set_scale(self.view.fit_scale(max(self.cell_size, 1)))
+                return True
+        return False
+
     def draw_maze(self, highlight_explored=None, highlight_path=None, color_type=None):
         self.screen.fill((248, 248, 248))
         pygame.draw.rect(self.screen, (200, 200, 200),
                         (self.maze_x - 5, self.maze_y - 5, 
                          self.maze_width + 10, self.maze_height + 10), 2)
-        maze_surface = pygame.Surface((self.maze_width, self.maze_height))
-        maze_surface.fill(CellType.PATH)
-        for y in range(self.rows):
-            for x in range(self.cols):
-                if self.maze[y, x] == 1:
-                    pygame.draw.rect(maze_surface, CellType.WALL,
-                                   (x * self.cell_size, y * self.cell_size,
-                                    self.cell_size, self.cell_size))
-        if highlight_explored:
-            explore_color = CellType.EXPLORED_DFS if color_type == "DFS" else CellType.EXPLORED_BFS
-            for ex, ey in highlight_explored:
-                pygame.draw.rect(maze_surface, explore_color,
-                               (ex * self.cell_size, ey * self.cell_size,
-                                self.cell_size, self.cell_size))
-        if highlight_path:
-            for px, py in highlight_path:
-                pygame.draw.rect(maze_surface, CellType.FINAL_PATH,
-                               (px * self.cell_size, py * self.cell_size,
-                                self.cell_size, self.cell_size))
-        pygame.draw.rect(maze_surface, CellType.START,
-                       (self.start[0] * self.cell_size, self.start[1] * self.cell_size,
-                        self.cell_size, self.cell_size))
-        pygame.draw.rect(maze_surface, CellType.END,
-                       (self.end[0] * self.cell_size, self.end[1] * self.cell_size,
-                        self.cell_size, self.cell_size))
-        self.screen.blit(maze_surface, (self.maze_x, self.maze_y))
+        # Rebuilding the state grid is costly on huge mazes, so a clean maze is kept
+        highlighted = any(cells is not None and len(cells)
+                          for cells in (highlight_explored, highlight_path))
+        if highlighted or not self.view_clean:
+            state = self.wall_state.copy()
+            if highlight_explored is not None:
+                self.mark_cells(state, highlight_explored, 2)
+            if highlight_path is not None:
+                self.mark_cells(state, highlight_path, 3)
+            self.mark_cells(state, [self.start], 4)
+            self.mark_cells(state, [self.end], 5)
+            self.view.set_state(state)
+            self.view_clean = not highlighted
+        self.view.set_palette(self.palette(color_type))
+        self.draw_view()
+
+    def draw_stats(self, stats):
+        """Clear and redraw only the stats lines; returns their screen rect"""
+        area = pygame.Rect(0, self.stats_y, self.window_width, 18 * 3)
+        self.screen.fill((248, 248, 248), area)
+        font_small = pygame.font.Font(None, 16)
+        y = self.stats_y
+        for stat in stats:
+            stat_text = font_small.render(stat, True, (80, 80, 80))
+            text_x = (self.window_width - stat_text.get_width()) // 2
+            self.screen.blit(stat_text, (text_x, y))
+            y += 18
+        return area
 
     def draw_ui_panel(self, stats=None):
-        self.new_maze_button.draw(self.screen)
-        self.dfs_button.draw(self.screen)
-        self.bfs_button.draw(self.screen)
-        self.compare_button.draw(self.screen)
-        self.exit_button.draw(self.screen)
+        for button in self.buttons:
+            button.draw(self.screen)
         if stats:
-            font_small = pygame.font.Font(None, 16)
-            y = self.stats_y
-            for stat in stats:
-                stat_text = font_small.render(stat, True, (80, 80, 80))
-                text_x = (self.window_width - stat_text.get_width()) // 2
-                self.screen.blit(stat_text, (text_x, y))
-                y += 18
-
-    def animate_search(self, start, end, explored, final_path, algorithm_name, color_type):
-        self.draw_maze()
+            self.draw_stats(stats)
+
+    def draw_progress_bar(self, playback):
+        """Scrub bar under the maze showing how far playback has got"""
+        area = self.progress_rect.inflate(0, 4)
+        self.screen.fill((248, 248, 248), area)
+        pygame.draw.rect(self.screen, (220, 220, 220), self.progress_rect)
+        if playback.total:
+            explored_end = self.progress_rect.width * playback.explored_count // playback.total
+            pygame.draw.line(self.screen, (150, 150, 150),
+                             (self.progress_rect.x + explored_end, self.progress_rect.y),
+                             (self.progress_rect.x + explored_end, self.progress_rect.bottom - 1))
+        filled = self.progress_rect.copy()
+        filled.width = int(self.progress_rect.width * playback.fraction)
+        pygame.draw.rect(self.screen, CellType.FINAL_PATH, filled)
+        return area
+
+    def show_step(self, shown, step, trace, color_type):
+        """
+        Bring the maze from `shown` timeline steps to `step`. Moving forward,
+        even at high speed, paints just the new cells; seeking back, or
+        jumping ahead by more than a sixteenth of the grid, where a rebuild
+        is cheaper, redraws everything in bulk. Returns the dirty rects, or
+        None after a full redraw.
+        """
+        explored_count = trace.explored_count
+        if step < shown or step - shown > self.maze.size // 16:
+            self.draw_maze(highlight_explored=trace.explored_cells(0, min(step, explored_count)),
+                           highlight_path=trace.path_cells(0, max(0, step - explored_count)),
+                           color_type=color_type)
+            self.draw_ui_panel()
+            return None
+        dirty = []
+        if shown < explored_count:
+            dirty.extend(self.paint_cells(trace.explored_cells(shown, min(step, explored_count)),
+                                          2))
+        if step > explored_count:
+            dirty.extend(self.paint_cells(trace.path_cells(max(0, shown - explored_count),
+                                                           step - explored_count), 3))
+        return dirty
+
+    def animate_result(self, result, duration=10.0):
+        """
+        Replay a SearchResult, e.g. one loaded from .npz. Playback reads its
+        read-only flat arrays in place and converts just the cells painted.
+        """
+        trace = ListTrace(result.explored, result.path, result.shape[1])
+        playback = Playback(len(result.explored), len(result.path), duration)
+        color_type = result.algorithm if result.algorithm in ALGORITHM_STYLES else "BFS"
+        return self.play(trace, playback, result.algorithm, color_type)
+
+    def animate_worker(self, solver, algorithm_name, duration=10.0):
+        """
+        Run the search on a SolverWorker thread and animate its events as they
+        arrive; the search is cancelled if playback is abandoned early.
+        """
+        worker = SolverWorker(solver, algorithm_name, self.start, self.end)
+        worker.start()
+        try:
+            result = self.animate_stream(worker, algorithm_name, algorithm_name, duration)
+        finally:
+            worker.cancel()
+        return result, worker.stats
+
+    def animate_stream(self, source, algorithm_name, color_type, duration=10.0):
+        open_cells = int(np.count_nonzero(self.maze == 0))
+        playback = Playback(open_cells, 0, duration)
+        playback.set_counts(0, 0, complete=False)
+        return self.play(StreamTrace(source, self.maze.shape), playback,
+                         algorithm_name, color_type)
+
+    def play(self, trace, playback, algorithm_name, color_type):
+        """
+        Run a trace as a timeline: explored cells, then the path. Cells per
+        frame follow wall-clock time, so a run takes about the playback's
+        duration at 1x regardless of size. SPACE pauses, LEFT/RIGHT change
+        speed, HOME/END jump, and the bar under the maze can be clicked or
+        dragged. The maze view can be zoomed and panned while it plays.
+        """
+        self.draw_maze(color_type=color_type)
         self.draw_ui_panel()
         pygame.display.flip()
-        pygame.time.wait(1000)
-        # PHASE 1: Animate exploration (interruptible by NEW MAZE)
-        for i, (ex, ey) in enumerate(explored):
+        lead_in, hold = 1.0, 1.5
+        shown = 0
+        scrubbing = False
+        while True:
+            dt = self.clock.tick(60) / 1000
+            moved = False
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return False, None
+                moved = self.handle_view_event(event) or moved
                 if event.type == pygame.MOUSEMOTION:
-                    self.new_maze_button.update_hover(event.pos)
+                    for button in self.buttons:
+                        button.update_hover(event.pos)
+                    if scrubbing:
+                        playback.seek_fraction((event.pos[0] - self.progress_rect.x)
+                                               / self.progress_rect.width)
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if self.new_maze_button.is_clicked(event.pos):
                         return "NEW_MAZE", None
-            self.draw_maze(highlight_explored=explored[:i+1], color_type=color_type)
-            progress_pct = ((i + 1) / len(explored)) * 100
-            self.draw_ui_panel([
-                f"{algorithm_name} - EXPLORING",
-                f"Cell {i+1}/{len(explored)} ({progress_pct:.1f}%)",
-                f"Strategy: {'Go DEEP (Stack)' if color_type == 'DFS' else 'Go BROAD (Queue)'}"
-            ])
-            pygame.display.flip()
-            self.clock.tick(15)
-
-        self.draw_maze(highlight_explored=explored, color_type=color_type)
-        self.draw_ui_panel([
-            f"{algorithm_name} - EXPLORATION COMPLETE",
-            f"✓ Total cells explored: {len(explored)}",
-            f"Now finding path from start to end..."
-        ])
-        pygame.display.flip()
-        pygame.time.wait(1000)
-        # PHASE 2: Animate path
-        for i, (px, py) in enumerate(final_path):
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return False, None
-                if event.type == pygame.MOUSEMOTION:
-                    self.new_maze_button.update_hover(event.pos)
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    if self.new_maze_button.is_clicked(event.pos):
-                        return "NEW_MAZE", None
-            self.draw_maze(highlight_explored=explored, 
-                          highlight_path=final_path[:i+1], 
-                          color_type=color_type)
-            progress_pct = ((i + 1) / len(final_path)) * 100
-            self.draw_ui_panel([
-                f"{algorithm_name} - BUILDING PATH",
-                f"Step {i+1}/{len(final_path)} ({progress_pct:.1f}%)",
-                f"Path so far: {len(final_path[:i+1])} steps traced"
-            ])
-            pygame.display.flip()
-            self.clock.tick(15)
-
-        self.draw_maze(highlight_explored=explored, 
-                      highlight_path=final_path, 
-                      color_type=color_type)
-        self.draw_ui_panel([
-            f"✓ {algorithm_name} - COMPLETE!",
-            f"Explored: {len(explored)} cells | Path: {len(final_path)} steps",
-            f"Route: Start {self.start} → End {self.end}"
-        ])
-        pygame.display.flip()
-        pygame.time.wait(1500)
-        return True, (len(explored), len(final_path))
+                    if self.exit_button.is_clicked(event.pos):
+                        return False, None
+                    if self.progress_rect.inflate(0, 10).collidepoint(event.pos):
+                        scrubbing = True
+                        lead_in = 0
+                        playback.seek_fraction((event.pos[0] - self.progress_rect.x)
+                                               / self.progress_rect.width)
+                if event.type == pygame.MOUSEBUTTONUP:
+                    scrubbing = False
+                if event.type == pygame.KEYDOWN:
+                    lead_in = 0
+                    if event.key == pygame.K_SPACE:
+                        playback.toggle_pause()
+                    elif event.key == pygame.K_RIGHT:
+                        playback.faster()
+                    elif event.key == pygame.K_LEFT:
+                        playback.slower()
+                    elif event.key == pygame.K_HOME:
+                        playback.seek(0)
+                    elif event.key == pygame.K_END:
+                        playback.seek(playback.total)
+
+            if not trace.complete:
+                ahead = playback.base_rate * playback.speed * max(dt, 1 / 60)
+                trace.pull(int(playback.position + ahead) + 1)
+                playback.set_counts(trace.explored_count, len(trace.path), trace.complete)
+            if lead_in > 0:
+                lead_in -= dt
+            elif not scrubbing:
+                playback.update(dt)
+            step = playback.step
+            dirty = self.show_step(shown, step, trace, color_type)
+            shown = step
+            if moved and dirty is not None:
+                dirty.append(self.draw_view())
+
+            explored_shown, path_shown = playback.split()
+            explored_total = trace.explored_count
+            paused = " (PAUSED)" if playback.paused else ""
+            if playback.phase == "EXPLORING":
+                if trace.complete:
+                    progress_pct = 100 * explored_shown / max(1, explored_total)
+                    cell_text = f"Cell {explored_shown}/{explored_total} ({progress_pct:.1f}%)"
+                else:
+                    cell_text = f"Cell {explored_shown} (searching...)"
+                stats = [
+                    f"{algorithm_name} - EXPLORING{paused}",
+                    f"{cell_text} | Speed {playback.speed}x",
+                    f"Strategy: {ALGORITHM_STYLES[color_type][2]}"
+                ]
+            elif playback.phase == "BUILDING PATH":
+                progress_pct = 100 * path_shown / max(1, len(trace.path))
+                stats = [
+                    f"{algorithm_name} - BUILDING PATH{paused}",
+                    f"Step {path_shown}/{len(trace.path)} ({progress_pct:.1f}%) | "
+                    f"Speed {playback.speed}x",
+                    f"✓ Total cells explored: {explored_total}"
+                ]
+            else:
+                stats = [
+                    f"✓ {algorithm_name} - COMPLETE!",
+                    f"Explored: {explored_total} cells | Path: {len(trace.path)} steps",
+                    f"Route: Start {self.start} → End {self.end}"
+                ]
+            for button in self.buttons:
+                button.draw(self.screen)
+            panel = [self.buttons_rect, self.draw_stats(stats),
+                     self.draw_progress_bar(playback)]
+            if dirty is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty + panel)
+
+            if playback.finished and not scrubbing:
+                hold -= dt
+                if hold <= 0:
+                    return True, (trace.explored_count, len(trace.path))
 
-    def show_comparison_screen(self, dfs_stats, bfs_stats):
-        dfs_explored, dfs_path = dfs_stats
-        bfs_explored, bfs_path = bfs_stats
+    def show_comparison_screen(self, results):
+        """Rank every algorithm run on this maze: shortest path, then fewest cells, then time"""
+        ranking = sorted(results.items(),
+                         key=lambda item: (item[1]["path_length"] == 0, item[1]["path_length"],
+                                           item[1]["expanded"], item[1]["time"]))
         waiting = True
         while waiting:
             self.screen.fill((248, 248, 248))
@@ -221,61 +439,53 @@ class MazeVisualizer:
             title = font_title.render("Algorithm Comparison", True, (33, 150, 243))
             title_rect = title.get_rect(center=(self.window_width // 2, 15))
             self.screen.blit(title, title_rect)
-            box_width = (self.window_width - 80) // 2
-            pygame.draw.rect(self.screen, CellType.EXPLORED_DFS, (30, 60, box_width, 130))
-            pygame.draw.rect(self.screen, (50, 100, 200), (30, 60, box_width, 130), 3)
-            dfs_title = font_header.render("DFS", True, (255, 255, 255))
-            self.screen.blit(dfs_title, (50, 70))
-            dfs_data = [
-                f"Cells: {dfs_explored}",
-                f"Path: {dfs_path} steps",
-                "Type: DEPTH-FIRST"
-            ]
-            y = 100
-            for data in dfs_data:
-                text = font_data.render(data, True, (255, 255, 255))
-                self.screen.blit(text, (50, y))
-                y += 25
-            bfs_x = 30 + box_width + 20
-            pygame.draw.rect(self.screen, CellType.EXPLORED_BFS, (bfs_x, 60, box_width, 130))
-            pygame.draw.rect(self.screen, (200, 100, 50), (bfs_x, 60, box_width, 130), 3)
-            bfs_title = font_header.render("BFS", True, (255, 255, 255))
-            self.screen.blit(bfs_title, (bfs_x + 20, 70))
-            bfs_data = [
-                f"Cells: {bfs_explored}",
-                f"Path: {bfs_path} steps",
-                "Type: BREADTH-FIRST"
-            ]
-            y = 100
-            for data in bfs_data:
-                text = font_data.render(data, True, (255, 255, 255))
-                self.screen.blit(text, (bfs_x + 20, y))
-                y += 25
-            y = 210
+            columns = [("#", 40), ("Algorithm", 80), ("Path", 220), ("Expanded", 320),
+                       ("Peak frontier", 440), ("Time (ms)", 580)]
+            y = 60
+            for label, x in columns:
+                text = font_header.render(label, True, (60, 60, 60))
+                self.screen.blit(text, (x, y))
+            y += 30
+            row_height = 34
+            for rank, (name, stats) in enumerate(ranking, 1):
+                fill, border, _ = ALGORITHM_STYLES[name]
+                pygame.draw.rect(self.screen, fill, (30, y, self.window_width - 60, row_height - 6))
+                pygame.draw.rect(self.screen, border, (30, y, self.window_width - 60, row_height - 6), 2)
+                path = f"{stats['path_length']} steps" if stats["path_length"] else "none"
+                cells = [str(rank), name, path, str(stats["expanded"]),
+                         str(stats["peak_frontier"]), f"{stats['time'] * 1000:.2f}"]
+                for value, (_, x) in zip(cells, columns):
+                    text = font_data.render(value, True, (255, 255, 255))
+                    self.screen.blit(text, (x, y + 8))
+                y += row_height
+            y += 10
             pygame.draw.line(self.screen, (200, 200, 200), (20, y), (self.window_width - 20, y), 2)
             analysis = font_header.render("Key Insights", True, (76, 175, 80))
             self.screen.blit(analysis, (20, y + 10))
             insights = []
-            if dfs_explored > bfs_explored:
-                diff = dfs_explored - bfs_explored
-                pct = 100 * diff / dfs_explored
-                insights.append(f"► BFS: {diff} fewer cells ({pct:.1f}%)")
-            elif bfs_explored > dfs_explored:
-                diff = bfs_explored - dfs_explored
-                pct = 100 * diff / bfs_explored
-                insights.append(f"► DFS: {diff} fewer cells ({pct:.1f}%)")
-            else:
-                insights.append("► Same cells explored")
-            if dfs_path < bfs_path:
-                insights.append(f"► DFS shorter: {dfs_path} vs {bfs_path}")
-            elif bfs_path < dfs_path:
-                insights.append(f"► BFS SHORTER: {bfs_path} vs {dfs_path} (BFS OPTIMAL!)")
-            else:
-                insights.append(f"► Same path: {dfs_path} steps")
+            if len(ranking) > 1:
+                fewest = min(results, key=lambda name: results[name]["expanded"])
+                most = max(results, key=lambda name: results[name]["expanded"])
+                diff = results[most]["expanded"] - results[fewest]["expanded"]
+                if diff:
+                    pct = 100 * diff / results[most]["expanded"]
+                    insights.append(f"► {fewest}: {diff} fewer cells than {most} ({pct:.1f}%)")
+                else:
+                    insights.append("► Same cells explored")
+                fastest = min(results, key=lambda name: results[name]["time"])
+                insights.append(f"► Fastest solve: {fastest} "
+                                f"({results[fastest]['time'] * 1000:.2f} ms)")
+                best_name, best = ranking[0]
+                longest = max(stats["path_length"] for stats in results.values())
+                if best["path_length"] and best["path_length"] < longest:
+                    insights.append(f"► {best_name} SHORTER: {best['path_length']} vs {longest}")
+                else:
+                    insights.append(f"► Same path: {best['path_length']} steps")
             insights.extend([
                 "► DFS uses Stack (LIFO)",
-                "► BFS uses Queue (FIFO)",
-                "► BFS GUARANTEES shortest path"
+                "► BFS uses Queue (FIFO), BI-BFS runs two queues",
+                "► A* uses a Heap ordered by steps + Manhattan distance",
+                "► BFS, BI-BFS and A* GUARANTEE shortest path"
             ])
             y += 40
             for insight in insights:
@@ -299,56 +509,210 @@ class MazeVisualizer:
             self.clock.tick(30)
         return True
 
+    def run_race(self, algorithms=("DFS", "BFS"), duration=10.0):
+        """
+        Race solvers on this maze: each one runs in its own worker process at
+        the same time, then both are replayed in split panes at the same
+        cells-per-frame rate. Returns the measured stats per algorithm, or
+        "NEW_MAZE" / False like the other screens.
+        """
+        context = multiprocessing.get_context("spawn")
+        pool = ProcessPoolExecutor(max_workers=len(algorithms), mp_context=context)
+        try:
+            futures = {name: pool.submit(race_job, self.maze, name, self.start, self.end)
+                       for name in algorithms}
+            while not all(future.done() for future in futures.values()):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        return False
+                    if event.type == pygame.MOUSEMOTION:
+                        for button in self.buttons:
+                            button.update_hover(event.pos)
+                    if event.type == pygame.MOUSEBUTTONDOWN:
+                        if self.new_maze_button.is_clicked(event.pos):
+                            return "NEW_MAZE"
+                self.draw_maze()
+                self.draw_ui_panel([f"Racing {' vs '.join(algorithms)} in worker processes..."])
+                pygame.display.flip()
+                self.clock.tick(30)
+            results = {name: future.result() for name, future in futures.items()}
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        # Each lane gets its own viewport over the pane, at the same fitted zoom
+        pane_size = ((self.window_width - 20) // len(algorithms) - 20, 420)
+        pane_x = [20 + n * (pane_size[0] + 20) for n in range(len(algorithms))]
+        pane_y = 50
+        views = {}
+        for name in algorithms:
+            state = self.wall_state.copy()
+            self.mark_cells(state, [self.start], 4)
+            self.mark_cells(state, [self.end], 5)
+            views[name] = Viewport(state, self.palette(name), pane_size)
+        scale = views[algorithms[0]].fit_scale(max(self.cell_size, 1))
+        for view in views.values():
+            view.set_scale(scale)
+        shown = {name: 0 for name in algorithms}
+        lanes = {name: (result.stats, result.explored, result.path)
+                 for name, result in results.items()}
+        totals = {name: len(explored) + len(path) for name, (_, explored, path) in lanes.items()}
+        playback = Playback(max(totals.values()), 0, duration)
+        close_button = Button(self.window_width - 130, self.window_height - 50, 110, 40,
+                             "CLOSE", (244, 67, 54), (255, 255, 255))
+        font_title = pygame.font.Font(None, 30)
+        font_data = pygame.font.Font(None, 20)
+
+        while True:
+            dt = self.clock.tick(60) / 1000
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return False
+                if event.type == pygame.MOUSEMOTION:
+                    close_button.update_hover(event.pos)
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if close_button.is_clicked(event.pos):
+                        return {name: stats for name, (stats, _, _) in lanes.items()}
+                    if self.new_maze_button.is_clicked(event.pos):
+                        return "NEW_MAZE"
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE:
+                        playback.toggle_pause()
+                    elif event.key == pygame.K_RIGHT:
+                        playback.faster()
+                    elif event.key == pygame.K_LEFT:
+                        playback.slower()
+                    elif event.key == pygame.K_END:
+                        playback.seek(playback.total)
+            step = playback.update(dt)
+
+            self.screen.fill((248, 248, 248))
+            title = font_title.render(f"Race: {' vs '.join(algorithms)}", True, (33, 150, 243))
+            self.screen.blit(title, title.get_rect(center=(self.window_width // 2, 22)))
+            for n, name in enumerate(algorithms):
+                stats, explored, path = lanes[name]
+                view = views[name]
+                # Both lanes advance by the same number of timeline steps; only
+                # the cells new since the last frame are painted
+                target = min(step, totals[name])
+                if target > shown[name]:
+                    first, last = shown[name], target
+                    e_first, e_last = min(first, len(explored)), min(last, len(explored))
+                    if e_last > e_first:
+                        ys, xs = np.divmod(explored[e_first:e_last], self.cols)
+                        view.mark(xs, ys, 2)
+                    p_first, p_last = max(0, first - len(explored)), max(0, last - len(explored))
+                    if p_last > p_first:
+                        ys, xs = np.divmod(path[p_first:p_last], self.cols)
+                        view.mark(xs, ys, 3)
+                    shown[name] = target
+                view.draw(self.screen, (pane_x[n], pane_y))
+                content_w, content_h = view.content_size()
+                border = pygame.Rect(0, 0, min(content_w, pane_size[0]), min(content_h, pane_size[1]))
+                border.center = (pane_x[n] + pane_size[0] // 2, pane_y + pane_size[1] // 2)
+                pygame.draw.rect(self.screen, ALGORITHM_STYLES[name][1], border.inflate(6, 6), 2)
+
+                done = shown[name] >= totals[name]
+                lines = [
+                    f"{name}{' - DONE' if done else ''}",
+                    f"Solve time: {stats['time'] * 1000:.2f} ms",
+                    f"Explored: {stats['expanded']} cells | Peak frontier: {stats['peak_frontier']}",
+                    f"Path: {stats['path_length']} steps",
+                ]
+                y = pane_y + pane_size[1] + 12
+                for line in lines:
+                    text = font_data.render(line, True, (60, 60, 60))
+                    self.screen.blit(text, (pane_x[n], y))
+                    y += 22
+
+            fastest = min(algorithms, key=lambda name: lanes[name][0]["time"])
+            fewest = min(algorithms, key=lambda name: lanes[name][0]["expanded"])
+            summary = [
+                f"► Fastest solve: {fastest} | Fewest cells: {fewest}",
+                f"► Replay: {step}/{playback.total} steps at {playback.speed}x"
+                f"{' (PAUSED)' if playback.paused else ''}  -  SPACE pause, LEFT/RIGHT speed",
+            ]
+            y = self.window_height - 100
+            for line in summary:
+                text = font_data.render(line, True, (60, 60, 60))
+                self.screen.blit(text, (20, y))
+                y += 22
+            close_button.draw(self.screen)
+            pygame.display.flip()
+
     def run_interactive(self, solver):
         running = True
-        dfs_last_result = None
-        bfs_last_result = None
+        last_results = {}
+        # Right-clicking the maze toggles walls; LPA* keeps the shortest path current
+        plan = None
+        redraw = True
         while running:
-            self.draw_maze()
+            if redraw:
+                self.draw_maze()
+                if plan is not None:
+                    self.show_plan(plan)
+                redraw = False
+            if plan is not None:
+                stats = plan.stats
+                edit_line = (f"LPA* repair: {stats['time'] * 1000:.2f} ms | "
+                             f"{stats['expanded']} cells re-expanded | Path: {stats['path_length']} steps")
+            else:
+                edit_line = "Right-click the maze to add or remove walls"
             self.draw_ui_panel([
                 f"Start: {self.start} | End: {self.end}",
-                f"{self.maze_size} ({self.cols}×{self.rows})"
+                f"{self.maze_size} ({self.cols}×{self.rows}) | Zoom {self.view.scale:g}x",
+                edit_line
             ])
             pygame.display.flip()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return False
+                if self.handle_view_event(event):
+                    self.draw_view()
                 if event.type == pygame.MOUSEMOTION:
-                    self.new_maze_button.update_hover(event.pos)
-                    self.dfs_button.update_hover(event.pos)
-                    self.bfs_button.update_hover(event.pos)
-                    self.compare_button.update_hover(event.pos)
-                    self.exit_button.update_hover(event.pos)
-                if event.type == pygame.MOUSEBUTTONDOWN:
+                    for button in self.buttons:
+                        button.update_hover(event.pos)
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:
+                    view_rect = pygame.Rect(self.maze_x, self.maze_y,
+                                            self.maze_width, self.maze_height)
+                    if view_rect.collidepoint(event.pos):
+                        cell = self.view.cell_at((event.pos[0] - self.maze_x,
+                                                  event.pos[1] - self.maze_y))
+                        previous = plan
+                        result = self.toggle_wall(solver, cell)
+                        if result is not None:
+                            plan = result
+                            self.show_plan(plan, previous)
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    # Buttons open other screens; the maze is redrawn when they return
+                    redraw = self.buttons_rect.collidepoint(event.pos)
                     if self.new_maze_button.is_clicked(event.pos):
                         return "NEW_MAZE"
-                    elif self.dfs_button.is_clicked(event.pos):
-                        dfs_path, dfs_explored = solver.dfs(self.start, self.end)
-                        result, stats = self.animate_search(self.start, self.end, dfs_explored, 
-                                                            dfs_path, "DFS", "DFS")
-                        if result == "NEW_MAZE":
-                            return "NEW_MAZE"
-                        if not result:
-                            return False
-                        dfs_last_result = stats
-                    elif self.bfs_button.is_clicked(event.pos):
-                        bfs_path, bfs_explored = solver.bfs(self.start, self.end)
-                        result, stats = self.animate_search(self.start, self.end, bfs_explored, 
-                                                            bfs_path, "BFS", "BFS")
+                    elif self.compare_button.is_clicked(event.pos):
+                        if len(last_results) >= 2:
+                            result = self.show_comparison_screen(last_results)
+                            if result == "NEW_MAZE":
+                                return "NEW_MAZE"
+                            if not result:
+                                return False
+                    elif self.race_button.is_clicked(event.pos):
+                        result = self.run_race()
                         if result == "NEW_MAZE":
                             return "NEW_MAZE"
                         if not result:
                             return False
-                        bfs_last_result = stats
-                    elif self.compare_button.is_clicked(event.pos):
-                        if dfs_last_result and bfs_last_result:
-                            result = self.show_comparison_screen(dfs_last_result, bfs_last_result)
+                        last_results.update(result)
+                    elif self.exit_button.is_clicked(event.pos):
+                        return False
+                    else:
+                        for name, button in self.solver_buttons.items():
+                            if not button.is_clicked(event.pos):
+                                continue
+                            (result, _), stats = self.animate_worker(solver, name)
                             if result == "NEW_MAZE":
                                 return "NEW_MAZE"
                             if not result:
                                 return False
-                    elif self.exit_button.is_clicked(event.pos):
-                        return False
+                            last_results[name] = dict(stats)
             self.clock.tick(30)
 
     def quit(self):
@@ -0,0 +1,71 @@
+import queue
+import threading
+
+from algorithms import MazeSolver
+
+def race_job(maze, algorithm, start, end):
+    """
+    Solve one race lane in a worker process. The SearchResult comes back
+    with stats timed in that process, free of the UI's GIL, and its int32
+    arrays keep the trip between processes small.
+    """
+    return MazeSolver(maze).solve(algorithm, start, end)
+
+class SolverWorker(threading.Thread):
+    """Runs MazeSolver.explore on a background thread and streams its events
+
+    Events travel through a bounded queue in batches, so the UI thread never
+    waits on the solver and a slow consumer simply holds the solver back.
+    The consumer calls poll() each frame; cancel() stops the search at the
+    next batch boundary.
+    """
+
+    def __init__(self, solver, algorithm, start, end, batch=512, max_batches=64):
+        super().__init__(daemon=True)
+        self.solver = solver
+        self.algorithm = algorithm
+        self.start_cell = start
+        self.end_cell = end
+        self.batch = batch
+        self.queue = queue.Queue(maxsize=max_batches)
+        self.cancelled = threading.Event()
+        self.done = False
+        self.stats = None
+
+    def run(self):
+        batch = []
+        for event in self.solver.explore(self.algorithm, self.start_cell, self.end_cell):
+            batch.append(event)
+            if len(batch) >= self.batch:
+                if not self._put(batch):
+                    return
+                batch = []
+        if batch and not self._put(batch):
+            return
+        # None marks the end of the stream; stats are complete by now
+        self.stats = self.solver.stats
+        self._put(None)
+
+    def _put(self, item):
+        while not self.cancelled.is_set():
+            try:
+                self.queue.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def poll(self):
+        """Next batch of events, [] if none is ready yet, None once the search is over"""
+        if self.done:
+            return None
+        try:
+            batch = self.queue.get_nowait()
+        except queue.Empty:
+            return []
+        if batch is None:
+            self.done = True
+        return batch
+
+    def cancel(self):
+        self.cancelled.set()